@@ -38,8 +38,10 @@ from tkinter import filedialog, messagebox, colorchooser, font
 from tkinter import ttk
 from PIL import Image, ImageTk, ImageDraw
 import json
+import math
 import os
 import time
+from time import monotonic_ns
 import threading
 import gc
 from concurrent.futures import ThreadPoolExecutor
@@ -47,6 +49,7 @@ import weakref
 from collections import OrderedDict
 import psutil
 import io
+import struct
 from functools import lru_cache
 import hashlib
 from dataclasses import dataclass
@@ -62,16 +65,102 @@ except ImportError:
     HAS_OPENCV = False
     
 try:
-    from numba import jit
+    from numba import jit, njit, prange
     HAS_NUMBA = True
 except ImportError:
     HAS_NUMBA = False
+    prange = range
+
+# Fast JSON serializer for project files (serializes NumPy arrays natively)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Tiled, compressed TIFF writer for exports
+try:
+    import tifffile
+    HAS_TIFFFILE = True
+except ImportError:
+    HAS_TIFFFILE = False
+
+# Detect Pillow-SIMD (drop-in replacement, `pip install pillow-simd`) - its versions carry a
+# ".postN" suffix and it accelerates resize/alpha_composite with SSE4/AVX2
+import PIL
+HAS_PILLOW_SIMD = 'post' in PIL.__version__
+
+# Resampling filter per kind of operation (all vectorized in Pillow-SIMD)
+RESAMP_PREVIEW = Image.Resampling.BILINEAR  # On-screen rendering, recomputed on every zoom/scroll
+RESAMP_DOWNSCALE = Image.Resampling.BOX  # Pyramid levels and thumbnails
+RESAMP_EXPORT = Image.Resampling.LANCZOS  # Pixels that end up in saved/merged output
 
 # Remove PIL image size limits to handle very large TIFF files
 Image.MAX_IMAGE_PIXELS = None  # Remove the default ~89MP limit
 import warnings
 warnings.filterwarnings("ignore", ".*exceeds limit.*", module="PIL")
 
+def _pnpoly(x, y, xs, ys):
+    """PNPOLY ray-crossing test of point (x, y) against closed vertex arrays (first vertex repeated last)"""
+    inside = False
+    for i in range(xs.shape[0] - 1):
+        if (ys[i] > y) != (ys[i + 1] > y):
+            # Cross-product side test instead of dividing for the intersection x
+            cross = (y - ys[i]) * (xs[i + 1] - xs[i]) - (x - xs[i]) * (ys[i + 1] - ys[i])
+            if (ys[i + 1] > ys[i]) == (cross > 0):
+                inside = not inside
+    return inside
+
+def _box_downsample(arr, factor):
+    """Average factor x factor blocks of an (H, W, C) uint8 array, rows spread across cores.
+    Sized like Image.reduce: partial right/bottom blocks are kept and averaged over their own pixels"""
+    height = arr.shape[0]
+    width = arr.shape[1]
+    out_h = (height + factor - 1) // factor
+    out_w = (width + factor - 1) // factor
+    channels = arr.shape[2]
+    out = np.empty((out_h, out_w, channels), dtype=np.uint8)
+    for oy in prange(out_h):
+        y0 = oy * factor
+        y1 = min(y0 + factor, height)
+        for ox in range(out_w):
+            x0 = ox * factor
+            x1 = min(x0 + factor, width)
+            area = (y1 - y0) * (x1 - x0)
+            for c in range(channels):
+                acc = 0
+                for row in range(y0, y1):
+                    for col in range(x0, x1):
+                        acc += int(arr[row, col, c])
+                out[oy, ox, c] = (acc + area // 2) // area
+    return out
+
+# Compile the hit-test and downsampling kernels to native code when Numba is available
+if HAS_NUMBA:
+    _pnpoly = njit(cache=True, fastmath=True)(_pnpoly)
+    _box_downsample = njit(parallel=True, cache=True)(_box_downsample)
+
+def _warmup_image_kernels():
+    """Compile the image kernels (run on the Tk thread once the UI is up - parallel Numba
+    kernels must not be called from two threads at once)"""
+    try:
+        tile = np.zeros((4, 4, 3), dtype=np.uint8)
+        _box_downsample(tile, 2)
+    except Exception as e:
+        print(f"Numba image kernel warmup failed: {e}")
+
+def _warmup_hit_test_kernels():
+    """Compile the hit-test kernel (small - done synchronously at import)"""
+    try:
+        closed = np.array([0.0, 1.0, 0.0, 0.0])
+        _pnpoly(0.5, 0.5, closed, closed)
+    except Exception as e:
+        print(f"Numba hit-test kernel warmup failed: {e}")
+
+# Trigger JIT compilation (or load from the on-disk cache) at import, before any user interaction
+if HAS_NUMBA:
+    _warmup_hit_test_kernels()
+
 class ImageEditor:
     def __init__(self, root):
         self.root = root
@@ -141,6 +230,7 @@ class ImageEditor:
         self.dragging_line = None  # Index of line being dragged
         self.line_drag_start = None  # Starting position of line drag
         self.line_objects = []  # Store canvas line object IDs for interaction
+        self._line_ids = {}  # Line index -> canvas item ID, repositioned with coords() while dragging
         self.line_drag_tolerance = 10  # Pixels tolerance for line selection
         
         # UI variables for lines (will be set during UI creation)
@@ -154,6 +244,9 @@ class ImageEditor:
         self.selected_section = None
         self.drag_start = None
         self.clipped_sections = []  # Store clipped sections as separate images
+        self._section_positions = np.zeros((0, 2), dtype=np.float32)  # SoA: (N, 2) section positions
+        self._section_sizes = np.zeros((0, 2), dtype=np.int32)  # SoA: (N, 2) section sizes
+        self._section_arrays_valid = False  # SoA arrays in sync with clipped_sections
         self.resize_mode = False  # Track if we're resizing
         self.resize_corner = None  # Which corner is being dragged for resize
         
@@ -162,10 +255,29 @@ class ImageEditor:
         self.show_grid = False  # Show grid overlay
         self.precise_mode = False  # Enable sub-pixel precision
         self.last_mouse_pos = None  # Track last mouse position for smooth movement
+        self._coord_label_dirty = False  # Coordinate label update pending for next idle cycle
+        self._coord_label_pos = (0.0, 0.0)  # Latest image coordinates under the mouse
+        self._pending_status = None  # Latest status message waiting to be shown
+        self._status_scheduled = False  # Status label flush already scheduled
+        self._status_written_ns = 0  # monotonic_ns() of the last status label write
+        self._redraw_pending = False  # display_image already scheduled via after_idle
+        self._drawn_sections = set()  # Sections drawn on the canvas since the last full section redraw
+        self._section_cull_pending = False  # Viewport changed - newly visible sections to draw
+        self._redraw_after_id = None  # Pending trailing redraw of a debounced burst (slider drags)
+        self._redraw_trailing = False  # A change arrived after the burst's leading redraw
+        self._last_render_state = None  # _render_state() at the last display_image call
+        self._section_rows = []  # Row texts currently shown in the sections listbox
+        self._stats_dirty = False  # Section counters waiting for the next idle update
+        self._slider_active = False  # Mouse held down on a slider/spinbox - redraw only the guide lines
+        self._preview_shown = False  # Lines-only preview on screen, full redraw due on release
         
         # DPI and measurement settings
         self.image_dpi = 300  # Default DPI for measurements (can be read from TIFF metadata)
+        self._px_per_cm = self.image_dpi / 2.54  # Cached conversion factor, refreshed on DPI change
+        self._cm_per_px = 1.0 / self._px_per_cm
         self.grid_size_cm = 1.0  # Grid size in centimeters (default 1cm)
+        self._grid_spacing_px = self.grid_size_cm * self._px_per_cm  # Refreshed on DPI/grid size change
+        self._grid_axis_cache = {}  # extent -> (positions, major mask) in image pixels
         
         # Ruler variables
         self.show_ruler = False  # Show movable ruler
@@ -173,11 +285,15 @@ class ImageEditor:
         self.ruler_end = None  # Ruler end point (x, y)
         self.ruler_dragging = False  # Track if ruler is being dragged
         self.ruler_drag_point = None  # Which point is being dragged: "start", "end", or "line"
+        self._ruler_item_ids = None  # Persistent canvas items: (line, start, end, label_bg, label)
         
         # Movement buffering for fluid motion
-        self.movement_buffer = []  # Buffer for smooth movement
         self.buffer_size = 3  # Reduced buffer size for faster response
-        self.last_update_time = 0  # Track time for frame rate limiting
+        self._mb = np.zeros((self.buffer_size, 2), dtype=np.float32)  # Ring buffer of recent (dx, dy)
+        self._mb_n = 0  # Number of valid entries in the ring buffer
+        self._mb_head = 0  # Next slot to write
+        self._weights = np.arange(1, self.buffer_size + 1, dtype=np.float32)  # Oldest -> newest weights
+        self.last_update_time = 0  # Track time for frame rate limiting (integer ms, monotonic)
         self.min_update_interval = 8  # Faster updates (125 FPS) for responsive movement
         self.movement_interpolation = False  # Disable interpolation for faster movement
         self.interpolation_steps = 1  # Reduced interpolation steps
@@ -185,6 +301,9 @@ class ImageEditor:
         # Multi-file merge variables
         self.loaded_files = []  # List of file paths for merging
         self.loaded_images = []  # List of PIL Image objects
+        self._merge_file_labels = {}  # path -> "basename (w×h)" listbox label
+        self._merge_preview_renders = OrderedDict()  # LRU of final preview images per layout
+        self._merge_preview_cache = None  # (key, per-file RGB thumbnails) shared by every preview layout
         self.merge_preview_window = None  # Preview window for merge arrangement
         self.merge_arrangement = "horizontal"  # horizontal, vertical, grid, freeform
         self.merge_spacing = 10  # Pixels between images when merging
@@ -201,6 +320,7 @@ class ImageEditor:
         
         # Performance optimization variables for drag-and-drop
         self.preview_images = []  # Downscaled images for fast drag-and-drop visualization
+        self._freeform_photo_cache = OrderedDict()  # LRU (preview id, scale) -> (PhotoImage, scaled image)
         self.preview_photos = []  # PhotoImage objects for preview images
         self.preview_scale_factor = 0.15  # Scale factor for preview images (15% of original)
         self.selected_image_index = None  # Currently selected image index
@@ -218,11 +338,17 @@ class ImageEditor:
         self.viewport_culling = True  # Only render visible portions
         self.async_rendering = True  # Use background threads for large operations
         self.max_display_pixels = 16_000_000  # Max pixels for display (4K = ~8MP, this is 16MP)
+        self.max_overlay_cache_pixels = 16_000_000  # Larger overlay composites are not kept between calls
         self.lazy_loading_enabled = True  # Lazy load image regions
         self.adaptive_quality = True  # Adjust quality based on zoom speed
         
         # Enhanced image pyramid system with GPU support
         self.image_pyramid = OrderedDict()  # LRU cache for pyramid levels
+        self._rebuild_executor = ThreadPoolExecutor(max_workers=1)  # Off-Tk-thread working image rebuilds
+        self._rebuild_generation = 0  # Only the newest submitted rebuild is applied
+        self._overlay_cache = None  # (key, image, refs) of the last _create_image_with_overlays result
+        self._grid_photo = None  # Keep a reference to the rasterized grid overlay
+        self._grid_photo_key = None  # (width, height, spacing) the rasterized grid overlay was built for
         self.pyramid_levels = [0.025, 0.05, 0.1, 0.2, 0.5, 0.75, 1.0]  # Enhanced resolution levels
         self.current_pyramid_level = 1.0  # Current level being used
         self.pyramid_cache_limit = min(psutil.virtual_memory().total // 4, 4 * 1024**3)  # Dynamic limit
@@ -262,6 +388,10 @@ class ImageEditor:
         
         self.setup_ui()
         
+        # Compile the image kernels once the window is idle, before the first image is loaded
+        if HAS_NUMBA:
+            self.root.after_idle(_warmup_image_kernels)
+        
     def create_button(self, parent, text, command, bg_color, fg_color='white', **kwargs):
         """Create a button with proper macOS styling"""
         if self.is_macos:
@@ -453,10 +583,25 @@ class ImageEditor:
                                    anchor=tk.E)
         self.coord_label.pack(side=tk.RIGHT, padx=10, pady=3)
     
-    def update_status(self, message):
-        """Update the status bar message"""
-        if hasattr(self, 'status_label'):
-            self.status_label.config(text=message)
+    def update_status(self, message, immediate=False):
+        """Update the status bar message (throttled to ~30 Hz: the first message of a burst is
+        written right away so text set before blocking work shows; later ones are coalesced)"""
+        self._pending_status = message
+        if self._status_scheduled and not immediate:
+            return
+        if immediate or monotonic_ns() - self._status_written_ns >= 33_000_000:
+            self._flush_status()
+        else:
+            self._status_scheduled = True
+            self.root.after(33, self._flush_status)
+    
+    def _flush_status(self):
+        """Write the latest pending status message to the status bar"""
+        self._status_scheduled = False
+        if self._pending_status is not None and hasattr(self, 'status_label'):
+            self.status_label.config(text=self._pending_status)
+            self._status_written_ns = monotonic_ns()
+        self._pending_status = None
     
     def update_image_info(self, info):
         """Update the image info in status bar"""
@@ -799,6 +944,8 @@ class ImageEditor:
                                    length=200, resolution=1)
         self.lines_scale.set(5)
         self.lines_scale.pack(fill=tk.X, pady=(5, 0))
+        self.lines_scale.bind('<ButtonPress-1>', self._on_slider_press)
+        self.lines_scale.bind('<ButtonRelease-1>', self._on_slider_release)
         
         # Line spacing with more precision
         spacing_frame = tk.Frame(lines_config_frame, bg='#f0f0f0')
@@ -824,7 +971,11 @@ class ImageEditor:
                                     textvariable=self.spacing_var, width=8, format="%.1f",
                                     command=self.update_line_spacing, font=('Arial', 9))
         spacing_spinbox.pack(side=tk.LEFT)
+        # Widgets locked together with the lines (confirm_lines / unlock_lines)
+        self._spacing_controls = [spacing_spinbox]
         spacing_spinbox.bind('<Return>', lambda e: self.update_line_spacing())
+        spacing_spinbox.bind('<ButtonPress-1>', self._on_slider_press)
+        spacing_spinbox.bind('<ButtonRelease-1>', self._on_slider_release)
         
         tk.Label(spacing_control_frame, text="cm spacing", font=('Arial', 9),
                 bg='#f0f0f0', fg='#666').pack(side=tk.LEFT, padx=(5, 0))
@@ -1050,8 +1201,8 @@ class ImageEditor:
                                height=self.canvas_height)
         
         # Simple scrollbars
-        v_scrollbar = tk.Scrollbar(canvas_area, orient=tk.VERTICAL, command=self.canvas.yview)
-        h_scrollbar = tk.Scrollbar(canvas_area, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        v_scrollbar = tk.Scrollbar(canvas_area, orient=tk.VERTICAL, command=self._canvas_yview)
+        h_scrollbar = tk.Scrollbar(canvas_area, orient=tk.HORIZONTAL, command=self._canvas_xview)
         
         self.canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
         
@@ -1059,6 +1210,10 @@ class ImageEditor:
         h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
+        # Track canvas size from geometry events instead of forcing layout flushes
+        self._canvas_w, self._canvas_h = self.canvas_width, self.canvas_height
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        
         # Bind mouse events
         self.canvas.bind("<Button-1>", self.on_canvas_click)
         self.canvas.bind("<B1-Motion>", self.on_mouse_drag)
@@ -1236,8 +1391,11 @@ class ImageEditor:
                 new_section = original_section.copy()
                 old_x, old_y = new_section['position']
                 new_section['position'] = (old_x + 20, old_y + 20)  # Offset by 20 pixels
+                new_section['offset'] = original_section['offset'].copy()  # Own copy (moves update it in place), boundary not shifted
+                new_section['boundary_i'] = None
                 new_section['id'] = len(self.clipped_sections)
                 self.clipped_sections.append(new_section)
+                self._invalidate_section_index()
                 self.update_sections_list()
                 self.display_image()
                 self.update_status("Section duplicated successfully")
@@ -1288,11 +1446,11 @@ class ImageEditor:
                 
                 # Convert to RGB if needed (this might take time for very large images)
                 if self.original_image.mode != 'RGB':
-                    self.update_status(f"Converting to RGB format...")
+                    self.update_status(f"Converting to RGB format...", immediate=True)
                     self.original_image = self.original_image.convert('RGB')
                 
-                # Create working copy
-                self.working_image = self.original_image.copy()
+                # Working image shares the original until the first in-place edit
+                self.working_image = self.original_image
                 
                 # Clear existing selections
                 self.current_selections = []
@@ -1323,8 +1481,9 @@ class ImageEditor:
                 
                 # Initialize performance optimizations after UI is ready
                 def init_optimizations():
-                    self.fit_to_window()
+                    # Build the pyramid first so the initial fit renders from a prebuilt level
                     self.optimize_image_loading()
+                    self.fit_to_window()
                 
                 self.root.after(100, init_optimizations)
                 
@@ -1414,6 +1573,7 @@ class ImageEditor:
                 # Even very low DPI values (like 1) or very high ones (like 10000) can be valid
                 old_dpi = self.image_dpi
                 self.image_dpi = extracted_dpi
+                self._update_dpi_cache()
                 self.dpi_var.set(str(extracted_dpi))
                 
                 # Provide more informative status messages
@@ -1466,6 +1626,102 @@ class ImageEditor:
             self._display_image_optimized()
         else:
             self._display_image_legacy()
+        self._last_render_state = self._render_state()
+        self._preview_shown = False
+    
+    def _render_state(self):
+        """Cheap tuple of the view settings that affect what display_image draws"""
+        return (self.image_scale, self.num_lines, self.line_spacing_cm, self.show_lines,
+                self.show_grid, self.grid_size_cm, self.show_ruler, self.ruler_start, self.ruler_end,
+                self.lines_confirmed, self.selected_section, self.image_dpi, len(self.clipped_sections))
+    
+    def _redraw_if_changed(self):
+        """Redraw only if the view settings differ from the last rendered frame"""
+        if self._render_state() != self._last_render_state:
+            self.display_image()
+    
+    def _on_canvas_configure(self, event):
+        """Remember the canvas size whenever Tk lays it out"""
+        self._canvas_w, self._canvas_h = event.width, event.height
+        self._schedule_section_cull()
+    
+    def _canvas_xview(self, *args):
+        """Horizontal scrollbar command - scroll, then draw sections that came into view"""
+        self.canvas.xview(*args)
+        self._schedule_section_cull()
+    
+    def _canvas_yview(self, *args):
+        """Vertical scrollbar command - scroll, then draw sections that came into view"""
+        self.canvas.yview(*args)
+        self._schedule_section_cull()
+    
+    def _schedule_section_cull(self):
+        """After a view change, draw newly visible sections once per idle cycle"""
+        if not self._section_cull_pending and self.clipped_sections:
+            self._section_cull_pending = True
+            self.canvas.after_idle(self._draw_newly_visible_sections)
+    
+    def _schedule_redraw(self, delay_ms=None):
+        """Coalesce redraw requests; with delay_ms, debounce bursts (leading + trailing redraw)"""
+        if delay_ms is None:
+            # One display_image call per idle cycle
+            if not self._redraw_pending:
+                self._redraw_pending = True
+                self.canvas.after_idle(self._do_redraw)
+            return
+        
+        if self._redraw_after_id is None:
+            # Leading edge: first change of a burst renders right away
+            self._schedule_redraw()
+        else:
+            self.root.after_cancel(self._redraw_after_id)
+            self._redraw_trailing = True
+        # Trailing edge: the last value of the burst is redrawn once it settles,
+        # only if it came after the leading redraw
+        self._redraw_after_id = self.root.after(delay_ms, self._do_debounced_redraw)
+    
+    def _do_redraw(self):
+        """Run a scheduled redraw"""
+        self._redraw_pending = False
+        if self._slider_active:
+            self._redraw_lines_preview()
+        else:
+            self.display_image()
+    
+    def _do_debounced_redraw(self):
+        """Run the trailing redraw of a debounced burst, if the burst had more than one change"""
+        self._redraw_after_id = None
+        if self._redraw_trailing:
+            self._redraw_trailing = False
+            if self._slider_active:
+                self._redraw_lines_preview()
+            else:
+                # A burst can end on the value the leading edge already rendered
+                self._redraw_if_changed()
+    
+    def _redraw_lines_preview(self):
+        """While a lines slider is held only the guide lines change - redraw just those and leave
+        the image, sections, grid and ruler items alone until release"""
+        self.canvas.delete("guide_lines")
+        if self.show_lines:
+            self.draw_vertical_lines()
+        self._preview_shown = True
+    
+    def _on_slider_press(self, event=None):
+        """Start of a slider drag - redraw only the guide lines until release"""
+        self._slider_active = True
+    
+    def _on_slider_release(self, event=None):
+        """End of a slider drag - full redraw if a lines preview or a redraw is outstanding"""
+        self._slider_active = False
+        pending = self._redraw_trailing
+        if self._redraw_after_id is not None:
+            self.root.after_cancel(self._redraw_after_id)
+            self._redraw_after_id = None
+        self._redraw_trailing = False
+        # A plain click never rendered a preview - nothing to replace
+        if pending or self._preview_shown:
+            self.display_image()
     
     def _display_image_optimized(self):
         """🚀 Advanced optimized display with GPU acceleration and smart caching"""
@@ -1473,8 +1729,8 @@ class ImageEditor:
             start_time = time.perf_counter()
             
             # Get viewport information with better precision
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
+            canvas_width = self._canvas_w
+            canvas_height = self._canvas_h
             
             # Calculate what's actually visible with sub-pixel precision
             scroll_x = self.canvas.canvasx(0)
@@ -1506,8 +1762,11 @@ class ImageEditor:
                 self.update_status(f"⚡ Cache hit: {render_time:.1f}ms (saved ~{cache_entry.get('estimated_render_time', 0):.0f}ms)")
             else:
                 self.cache_miss_count += 1
-                # Calculate optimal pyramid level
-                optimal_level = self._get_optimal_pyramid_level()
+                
+                # Calculate optimal pyramid level, preferring one that reaches the zoom by an
+                # exact integer reduce
+                optimal_level = (self._get_integer_reduce_level(self.image_scale) or
+                                 self._get_optimal_pyramid_level())
                 
                 # Get or create pyramid level
                 pyramid_img = self._get_pyramid_level(optimal_level)
@@ -1522,19 +1781,23 @@ class ImageEditor:
                 total_pixels = display_width * display_height
                 if total_pixels > self.max_display_pixels:
                     # Use simplified rendering for massive images
-                    display_img = pyramid_img.resize((display_width, display_height), Image.Resampling.LANCZOS)
+                    display_img = pyramid_img.resize((display_width, display_height), RESAMP_PREVIEW)
                     self.update_status(f"🔍 Large image optimization: {display_width}x{display_height}")
                 else:
                     # Standard rendering for manageable sizes
                     pyramid_scale = optimal_level
                     pyramid_display_scale = self.image_scale / pyramid_scale
                     
-                    if abs(pyramid_display_scale - 1.0) > 0.01:
+                    reduce_factor = round(1.0 / pyramid_display_scale)
+                    if reduce_factor >= 2 and abs(pyramid_display_scale * reduce_factor - 1.0) < 1e-6:
+                        # Exact 1/N scale - Pillow's fixed-stride box reduce, no fractional resampling
+                        display_img = pyramid_img.reduce(reduce_factor)
+                    elif abs(pyramid_display_scale - 1.0) > 0.01:
                         new_width = int(pyramid_img.size[0] * pyramid_display_scale)
                         new_height = int(pyramid_img.size[1] * pyramid_display_scale)
                         new_width = max(1, min(new_width, 32000))
                         new_height = max(1, min(new_height, 32000))
-                        display_img = pyramid_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                        display_img = pyramid_img.resize((new_width, new_height), RESAMP_PREVIEW)
                     else:
                         display_img = pyramid_img
                 
@@ -1584,8 +1847,12 @@ class ImageEditor:
             display_width = max(display_width, 1)
             display_height = max(display_height, 1)
             
-            # Resize image for display
-            display_img = self.working_image.resize((display_width, display_height), Image.Resampling.LANCZOS)
+            # Resize image for display (exact 1/N zoom takes Pillow's integer reduce path)
+            reduce_factor = round(1.0 / self.image_scale)
+            if reduce_factor >= 2 and abs(self.image_scale * reduce_factor - 1.0) < 1e-6:
+                display_img = self.working_image.reduce(reduce_factor)
+            else:
+                display_img = self.working_image.resize((display_width, display_height), RESAMP_PREVIEW)
             
             # Convert to PhotoImage
             self.photo_image = ImageTk.PhotoImage(display_img)
@@ -1620,18 +1887,28 @@ class ImageEditor:
     
     # 🚀 OPTIMIZATION SUPPORT METHODS
     
-    def _get_optimal_pyramid_level(self):
-        """Determine the best pyramid level for current zoom"""
-        if self.image_scale >= 1.0:
-            return 1.0  # Use full resolution for zoom in
-        elif self.image_scale >= 0.5:
-            return 0.5
-        elif self.image_scale >= 0.25:
-            return 0.25
-        elif self.image_scale >= 0.1:
+    def _get_optimal_pyramid_level(self, scale=None):
+        """Smallest pyramid level at least as large as the current zoom (or an explicit scale)"""
+        if scale is None:
+            scale = self.image_scale
+        if scale <= 0.05:
+            return 0.05
+        elif scale <= 0.1:
             return 0.1
+        elif scale <= 0.25:
+            return 0.25
+        elif scale <= 0.5:
+            return 0.5
         else:
-            return 0.05
+            return 1.0  # Use full resolution for zoom in
+    
+    def _get_integer_reduce_level(self, scale, max_factor=4):
+        """Coarsest pyramid level that maps to scale by an integer factor <= max_factor, or None"""
+        for level in (0.05, 0.1, 0.25, 0.5, 1.0):
+            factor = level / scale
+            if 1.0 <= round(factor) <= max_factor and abs(factor - round(factor)) < 1e-6:
+                return level
+        return None
     
     def _get_pyramid_level(self, level):
         """Get or create a pyramid level"""
@@ -1651,11 +1928,36 @@ class ImageEditor:
                 new_width = max(1, int(orig_width * level))
                 new_height = max(1, int(orig_height * level))
                 
-                # Use high-quality resampling for pyramid levels
-                self.image_pyramid[level] = self.working_image.resize(
-                    (new_width, new_height), 
-                    Image.Resampling.LANCZOS
-                )
+                # Reduce from the smallest finer level that divides evenly (0.25 from 0.5,
+                # 0.05 from 0.1, ...) instead of re-reading the full-resolution image
+                src_level, src_img = 1.0, self.working_image
+                for finer in sorted(self.image_pyramid):
+                    ratio = finer / level
+                    if level < finer < 1.0 and abs(ratio - round(ratio)) < 1e-6:
+                        src_level, src_img = finer, self.image_pyramid[finer]
+                        break
+                factor = int(round(src_level / level))
+                
+                if (abs(factor * level - src_level) < 1e-6 and
+                        src_img.size[0] >= factor and src_img.size[1] >= factor):
+                    if HAS_NUMBA and src_img.mode in ('L', 'RGB', 'RGBA'):
+                        # Integer factor - parallel box downsample across all cores
+                        arr = np.asarray(src_img)
+                        if arr.ndim == 2:
+                            arr = arr[:, :, None]
+                        reduced = _box_downsample(arr, factor)
+                        if src_img.mode == 'L':
+                            reduced = reduced[:, :, 0]
+                        self.image_pyramid[level] = Image.fromarray(reduced, src_img.mode)
+                    else:
+                        # Integer factor - Pillow's fixed-stride box reduce
+                        self.image_pyramid[level] = src_img.reduce(factor)
+                else:
+                    # Area-averaging downscale for pyramid levels
+                    self.image_pyramid[level] = self.working_image.resize(
+                        (new_width, new_height), 
+                        RESAMP_DOWNSCALE
+                    )
                 
             print(f"Created pyramid level {level}: {self.image_pyramid[level].size}")
             
@@ -1664,44 +1966,6 @@ class ImageEditor:
             # Fallback to working image
             self.image_pyramid[level] = self.working_image.copy()
     
-    def _render_viewport_only(self, source_img, scroll_x, scroll_y, visible_width, visible_height):
-        """Render only the visible viewport for massive images"""
-        try:
-            # Calculate the region of the source image that's visible
-            source_width, source_height = source_img.size
-            
-            # Convert scroll coordinates to source image coordinates
-            scale_factor = source_width / (self.original_image.size[0] * self.image_scale)
-            
-            source_x = int(scroll_x * scale_factor)
-            source_y = int(scroll_y * scale_factor)
-            source_right = min(source_width, int((scroll_x + visible_width) * scale_factor))
-            source_bottom = min(source_height, int((scroll_y + visible_height) * scale_factor))
-            
-            # Ensure valid crop region
-            source_x = max(0, source_x)
-            source_y = max(0, source_y)
-            crop_width = source_right - source_x
-            crop_height = source_bottom - source_y
-            
-            if crop_width <= 0 or crop_height <= 0:
-                # Return a small fallback image
-                return Image.new('RGB', (visible_width, visible_height), 'white')
-            
-            # Crop the visible region
-            viewport_img = source_img.crop((source_x, source_y, source_right, source_bottom))
-            
-            # Resize to visible dimensions
-            if viewport_img.size != (visible_width, visible_height):
-                viewport_img = viewport_img.resize((visible_width, visible_height), Image.Resampling.LANCZOS)
-            
-            return viewport_img
-            
-        except Exception as e:
-            print(f"Error in viewport rendering: {e}")
-            # Return fallback
-            return Image.new('RGB', (visible_width, visible_height), 'lightgray')
-    
     def _cache_display_result(self, key, photo_image, width, height):
         """Cache display result with size management"""
         # Remove old entries if cache is full
@@ -1717,6 +1981,48 @@ class ImageEditor:
             'timestamp': time.time()
         }
     
+    def _invalidate_cached_region(self, bbox):
+        """Invalidate cached renders after an in-place edit of an image-space bbox (pyramid levels patched)"""
+        x0, y0, x1, y1 = bbox
+        
+        # Display cache: every entry is a whole-image frame, so any edit makes all of them stale
+        self.display_cache.clear()
+        
+        # Working image was edited in place - its id no longer identifies the overlay render
+        self._overlay_cache = None
+        
+        # Pyramid levels: re-render just the bbox area instead of rebuilding whole levels
+        orig_width, orig_height = self.working_image.size
+        stale_levels = []
+        for level, level_img in self.image_pyramid.items():
+            try:
+                if level_img.mode != self.working_image.mode:
+                    raise ValueError("mode mismatch")
+                sx = level_img.size[0] / orig_width
+                sy = level_img.size[1] / orig_height
+                # Level-space rect, padded for the resampling filter support
+                lx0 = max(0, int(x0 * sx) - 2)
+                ly0 = max(0, int(y0 * sy) - 2)
+                lx1 = min(level_img.size[0], int(np.ceil(x1 * sx)) + 2)
+                ly1 = min(level_img.size[1], int(np.ceil(y1 * sy)) + 2)
+                if lx1 <= lx0 or ly1 <= ly0:
+                    continue
+                if level == 1.0:
+                    patch = self.working_image.crop((lx0, ly0, lx1, ly1))
+                else:
+                    patch = self.working_image.resize(
+                        (lx1 - lx0, ly1 - ly0), RESAMP_DOWNSCALE,
+                        box=(lx0 / sx, ly0 / sy, lx1 / sx, ly1 / sy)
+                    )
+                level_img.paste(patch, (lx0, ly0))
+            except Exception as e:
+                print(f"Error patching pyramid level {level}: {e}")
+                stale_levels.append(level)
+        
+        # Levels that could not be patched are rebuilt on next use
+        for level in stale_levels:
+            del self.image_pyramid[level]
+    
     def _schedule_overlay_rendering(self):
         """Efficiently schedule overlay rendering"""
         # Use a single delayed call to render all overlays
@@ -1747,6 +2053,9 @@ class ImageEditor:
         """Clear all image caches to free memory"""
         self.image_pyramid.clear()
         self.display_cache.clear()
+        self._overlay_cache = None
+        self._grid_photo = None
+        self._grid_photo_key = None
         if self.auto_garbage_collect:
             gc.collect()
         self.update_status("🗑️ Image cache cleared - memory freed")
@@ -1851,7 +2160,7 @@ class ImageEditor:
             
             # Pre-generate commonly used pyramid levels
             if self.enable_fast_zoom:
-                self.update_status("🚀 Pre-generating pyramid levels...")
+                self.update_status("🚀 Pre-generating pyramid levels...", immediate=True)
                 
                 # Generate levels based on image size
                 img_size = self.original_image.size[0] * self.original_image.size[1]
@@ -1863,7 +2172,8 @@ class ImageEditor:
                 else:  # Smaller images
                     levels_to_create = [0.25, 0.5]
                 
-                for level in levels_to_create:
+                # Finest first, so each coarser level is reduced from the previous one
+                for level in sorted(levels_to_create, reverse=True):
                     self._create_pyramid_level(level)
                     # Allow UI to remain responsive
                     self.root.update_idletasks()
@@ -1888,8 +2198,44 @@ class ImageEditor:
         
         # Clear section photos to prevent memory leaks
         self.section_photos = []
-        
-        for i, section in enumerate(self.clipped_sections):
+        self._drawn_sections = set()
+        self._draw_visible_sections()
+    
+    def _draw_newly_visible_sections(self):
+        """Draw sections scrolled into view since the last redraw, just above the image like a full redraw"""
+        self._section_cull_pending = False
+        items = self.canvas.find_all()
+        if not items:
+            return
+        drawn_before = len(self._drawn_sections)
+        self._draw_visible_sections()
+        if len(self._drawn_sections) == drawn_before:
+            return
+        # New items went on top of the lines/grid/ruler - restack all drawn sections right above
+        # the image in index order, so the canvas z-order matches _find_topmost_section
+        below = items[0]
+        for i in sorted(self._drawn_sections):
+            tag = f"section_{i}"
+            if self.canvas.find_withtag(tag):
+                self.canvas.tag_raise(tag, below)
+                below = tag
+    
+    def _draw_visible_sections(self):
+        """Draw the sections overlapping the viewport that are not on the canvas yet"""
+        # Visible canvas rect (computed once per frame) for viewport culling
+        vx0 = self.canvas.canvasx(0)
+        vy0 = self.canvas.canvasy(0)
+        vx1 = vx0 + self._canvas_w
+        vy1 = vy0 + self._canvas_h
+        
+        # Cull all sections against the viewport in one vectorized test
+        visible = self._sections_in_rect(vx0, vy0, vx1, vy1, self.image_scale)
+        
+        for i in visible.tolist():
+            if i in self._drawn_sections:
+                continue
+            self._drawn_sections.add(i)
+            section = self.clipped_sections[i]
             print(f"DEBUG: Drawing section {i}: pos={section['position']}, size={section['size']}, color={section['color']}")
             # Calculate scaled position
             x, y = section['position']
@@ -1906,7 +2252,7 @@ class ImageEditor:
             if scaled_width > 0 and scaled_height > 0:
                 print(f"DEBUG: Resizing section {i} image for display")
                 # Resize the clipped section for display
-                display_section = section['image'].resize((scaled_width, scaled_height), Image.Resampling.LANCZOS)
+                display_section = section['image'].resize((scaled_width, scaled_height), RESAMP_PREVIEW)
                 
                 print(f"DEBUG: Converting section {i} to PhotoImage")
                 # Convert to PhotoImage
@@ -1917,7 +2263,7 @@ class ImageEditor:
                 
                 print(f"DEBUG: Drawing section {i} on canvas at ({scaled_x}, {scaled_y})")
                 # Draw on canvas
-                img_id = self.canvas.create_image(scaled_x, scaled_y, anchor=tk.NW, image=section_photo, tags=f"clipped_{i}")
+                img_id = self.canvas.create_image(scaled_x, scaled_y, anchor=tk.NW, image=section_photo, tags=(f"clipped_{i}", f"section_{i}"))
                 print(f"DEBUG: Section {i} canvas image ID: {img_id}")
                 
                 # Draw border around clipped section
@@ -1933,7 +2279,7 @@ class ImageEditor:
                 self.canvas.create_rectangle(
                     scaled_x, scaled_y, 
                     scaled_x + scaled_width, scaled_y + scaled_height,
-                    outline=border_color, width=border_width, tags=f"clipped_border_{i}"
+                    outline=border_color, width=border_width, tags=(f"clipped_border_{i}", f"section_{i}")
                 )
                 
                 # Draw resize handles if in move mode
@@ -1943,25 +2289,25 @@ class ImageEditor:
                     self.canvas.create_rectangle(
                         scaled_x - handle_size//2, scaled_y - handle_size//2,
                         scaled_x + handle_size//2, scaled_y + handle_size//2,
-                        fill="blue", outline="darkblue", tags=f"handle_tl_{i}"
+                        fill="blue", outline="darkblue", tags=(f"handle_tl_{i}", f"section_{i}")
                     )
                     # Top-right corner
                     self.canvas.create_rectangle(
                         scaled_x + scaled_width - handle_size//2, scaled_y - handle_size//2,
                         scaled_x + scaled_width + handle_size//2, scaled_y + handle_size//2,
-                        fill="blue", outline="darkblue", tags=f"handle_tr_{i}"
+                        fill="blue", outline="darkblue", tags=(f"handle_tr_{i}", f"section_{i}")
                     )
                     # Bottom-left corner
                     self.canvas.create_rectangle(
                         scaled_x - handle_size//2, scaled_y + scaled_height - handle_size//2,
                         scaled_x + handle_size//2, scaled_y + scaled_height + handle_size//2,
-                        fill="blue", outline="darkblue", tags=f"handle_bl_{i}"
+                        fill="blue", outline="darkblue", tags=(f"handle_bl_{i}", f"section_{i}")
                     )
                     # Bottom-right corner
                     self.canvas.create_rectangle(
                         scaled_x + scaled_width - handle_size//2, scaled_y + scaled_height - handle_size//2,
                         scaled_x + scaled_width + handle_size//2, scaled_y + scaled_height + handle_size//2,
-                        fill="blue", outline="darkblue", tags=f"handle_br_{i}"
+                        fill="blue", outline="darkblue", tags=(f"handle_br_{i}", f"section_{i}")
                     )
                         
     def on_mouse_down(self, event):
@@ -2144,21 +2490,31 @@ class ImageEditor:
             else:
                 self.canvas.config(cursor="arrow")
         
-        # Show coordinates in coordinate label (both pixels and cm)
+        # Show coordinates in coordinate label - coalesced to once per idle cycle
         if hasattr(self, 'coord_label'):
-            # Convert to centimeters
-            x_cm = self.pixels_to_cm(image_x)
-            y_cm = self.pixels_to_cm(image_y)
-            
-            if self.snap_to_grid:
-                snap_x, snap_y = self.snap_to_grid_position(image_x, image_y)
-                snap_x_cm = self.pixels_to_cm(snap_x)
-                snap_y_cm = self.pixels_to_cm(snap_y)
-                self.coord_label.config(text=f"({image_x:.1f}px, {image_y:.1f}px) | ({x_cm:.2f}cm, {y_cm:.2f}cm) → Snap: ({snap_x:.0f}px, {snap_y:.0f}px) | ({snap_x_cm:.2f}cm, {snap_y_cm:.2f}cm)")
-            elif self.precise_mode:
-                self.coord_label.config(text=f"Pos: ({image_x:.2f}px, {image_y:.2f}px) | ({x_cm:.2f}cm, {y_cm:.2f}cm)")
-            else:
-                self.coord_label.config(text=f"Pos: ({int(image_x)}px, {int(image_y)}px) | ({x_cm:.2f}cm, {y_cm:.2f}cm)")
+            self._coord_label_pos = (image_x, image_y)
+            if not self._coord_label_dirty:
+                self._coord_label_dirty = True
+                self.canvas.after_idle(self._update_coord_label)
+    
+    def _update_coord_label(self):
+        """Refresh the coordinate label (both pixels and cm) from the latest mouse position"""
+        self._coord_label_dirty = False
+        image_x, image_y = self._coord_label_pos
+        
+        # Convert to centimeters
+        x_cm = self.pixels_to_cm(image_x)
+        y_cm = self.pixels_to_cm(image_y)
+        
+        if self.snap_to_grid:
+            snap_x, snap_y = self.snap_to_grid_position(image_x, image_y)
+            snap_x_cm = self.pixels_to_cm(snap_x)
+            snap_y_cm = self.pixels_to_cm(snap_y)
+            self.coord_label.config(text=f"({image_x:.1f}px, {image_y:.1f}px) | ({x_cm:.2f}cm, {y_cm:.2f}cm) → Snap: ({snap_x:.0f}px, {snap_y:.0f}px) | ({snap_x_cm:.2f}cm, {snap_y_cm:.2f}cm)")
+        elif self.precise_mode:
+            self.coord_label.config(text=f"Pos: ({image_x:.2f}px, {image_y:.2f}px) | ({x_cm:.2f}cm, {y_cm:.2f}cm)")
+        else:
+            self.coord_label.config(text=f"Pos: ({int(image_x)}px, {int(image_y)}px) | ({x_cm:.2f}cm, {y_cm:.2f}cm)")
     
     def on_key_press(self, event):
         """Handle keyboard shortcuts for precise movement and image navigation"""
@@ -2282,8 +2638,8 @@ class ImageEditor:
                 self.ruler_start = (new_start_x, new_start_y)
                 self.ruler_end = (new_start_x + dx, new_start_y + dy)
         
-        # Redraw with updated ruler
-        self.display_image()
+        # Move the existing ruler items instead of rebuilding the whole scene
+        self.draw_ruler()
         return True
     
     def _handle_ruler_release(self):
@@ -2303,11 +2659,13 @@ class ImageEditor:
             return True
         return False
     
-    def _point_distance(self, x1, y1, x2, y2):
+    @staticmethod
+    def _point_distance(x1, y1, x2, y2):
         """Calculate distance between two points"""
-        return ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+        return math.hypot(x2 - x1, y2 - y1)
     
-    def _point_to_line_distance(self, px, py, line_start, line_end):
+    @staticmethod
+    def _point_to_line_distance(px, py, line_start, line_end):
         """Calculate distance from point to line segment"""
         x1, y1 = line_start
         x2, y2 = line_end
@@ -2316,7 +2674,7 @@ class ImageEditor:
         line_len_sq = (x2 - x1) ** 2 + (y2 - y1) ** 2
         
         if line_len_sq == 0:
-            return self._point_distance(px, py, x1, y1)
+            return math.hypot(px - x1, py - y1)
         
         # Parameter t that represents position along the line
         t = max(0, min(1, ((px - x1) * (x2 - x1) + (py - y1) * (y2 - y1)) / line_len_sq))
@@ -2325,28 +2683,24 @@ class ImageEditor:
         closest_x = x1 + t * (x2 - x1)
         closest_y = y1 + t * (y2 - y1)
         
-        return self._point_distance(px, py, closest_x, closest_y)
+        return math.hypot(px - closest_x, py - closest_y)
         
     def _handle_line_click(self, canvas_x, canvas_y):
         """Handle clicking on a vertical line for dragging"""
         if not self.line_positions or not self.original_image:
             return False
         
-        # Convert canvas coordinates to image coordinates
-        image_x = canvas_x / self.image_scale
+        # Distance from click to every line in one vectorized pass
+        diffs = np.abs(canvas_x - np.asarray(self.line_positions) * self.image_scale)
+        i = int(np.argmin(diffs))
         
-        # Check if click is near any line
-        for i, line_x in enumerate(self.line_positions):
-            line_display_x = line_x * self.image_scale
-            distance = abs(canvas_x - line_display_x)
-            
-            if distance <= self.line_drag_tolerance:
-                self.dragging_line = i
-                self.line_drag_start = (canvas_x, canvas_y)
-                self.update_status(f"Dragging vertical line {i + 1} - drag to reposition")
-                # Redraw to show dragging color
-                self.display_image()
-                return True
+        if diffs[i] <= self.line_drag_tolerance:
+            self.dragging_line = i
+            self.line_drag_start = (canvas_x, canvas_y)
+            self.update_status(f"Dragging vertical line {i + 1} - drag to reposition")
+            # Restyle just this line to show dragging color
+            self._update_line_item(i)
+            return True
         
         return False
     
@@ -2365,8 +2719,8 @@ class ImageEditor:
         # Update line position
         self.line_positions[self.dragging_line] = new_image_x
         
-        # Redraw to show new position
-        self.display_image()
+        # Reposition the line item in place
+        self._update_line_item(self.dragging_line)
         
         # Update status with position info
         cm_from_left = self.pixels_to_cm(new_image_x)
@@ -2377,12 +2731,38 @@ class ImageEditor:
         """Handle releasing a dragged line"""
         if self.dragging_line is not None:
             self.update_status(f"Line {self.dragging_line + 1} positioned")
+            released_line = self.dragging_line
             self.dragging_line = None
             self.line_drag_start = None
-            # Redraw to remove dragging color
-            self.display_image()
+            # Restyle the line to remove dragging color
+            self._update_line_item(released_line)
             return True
         return False
+    
+    def _canvas_item_exists(self, item_id):
+        """Check whether a canvas item ID still refers to a live item"""
+        return item_id is not None and bool(self.canvas.type(item_id))
+    
+    def _line_style(self, i):
+        """Return (color, width) for vertical line i based on its state"""
+        if self.lines_confirmed:
+            return '#00FF00', 3  # Green if confirmed
+        if self.dragging_line == i:
+            return '#FFD700', 4  # Gold if being dragged
+        return '#FF0000', 2  # Red if not confirmed
+    
+    def _update_line_item(self, i):
+        """Reposition and restyle a single vertical line item without a full redraw"""
+        line_id = self._line_ids.get(i)
+        if not self._canvas_item_exists(line_id):
+            self.display_image()
+            return
+        
+        x_pos_display = self.line_positions[i] * self.image_scale
+        display_height = int(self.original_image.size[1] * self.image_scale)
+        line_color, line_width = self._line_style(i)
+        self.canvas.coords(line_id, x_pos_display, 0, x_pos_display, display_height)
+        self.canvas.itemconfig(line_id, fill=line_color, width=line_width)
             
         # Get currently selected section from listbox
         selection = self.sections_listbox.curselection()
@@ -2491,11 +2871,10 @@ class ImageEditor:
                 final_height = int(original_height * scale_factor)
                 
                 # Update section data
-                section['position'] = (new_x, new_y)
-                section['size'] = (final_width, final_height)
+                self._update_section_geometry(section_idx, (new_x, new_y), (final_width, final_height))
                 
                 # Resize the actual image maintaining aspect ratio
-                resized_image = section['original_image'].resize((final_width, final_height), Image.Resampling.LANCZOS)
+                resized_image = section['original_image'].resize((final_width, final_height), RESAMP_EXPORT)
                 section['image'] = resized_image
                 
                 # Update boundary for hit detection (scale the original boundary proportionally)
@@ -2506,10 +2885,10 @@ class ImageEditor:
                     # Use the same scale factor for both dimensions
                     scale_factor = min(final_width / (bbox[2] - bbox[0]), final_height / (bbox[3] - bbox[1]))
                     
-                    section['boundary'] = [
-                        (new_x + (pt[0] - bbox[0]) * scale_factor, new_y + (pt[1] - bbox[1]) * scale_factor)
-                        for pt in original_boundary
-                    ]
+                    self._set_section_boundary(section, (
+                        (original_boundary - np.array(bbox[:2], dtype=np.float32)) * scale_factor
+                        + np.array((new_x, new_y), dtype=np.float32)
+                    ).astype(np.float32))
                 
                 self.display_image()
         
@@ -2520,75 +2899,62 @@ class ImageEditor:
             print(f"DEBUG: Path too short, returning")
             return
             
-        # Create mask for the selection
-        mask = Image.new('L', self.original_image.size, 0)
-        draw = ImageDraw.Draw(mask)
+        # Bounding box of the selection, clamped to the image
         pil_path = [(int(x), int(y)) for x, y in path]
-        draw.polygon(pil_path, fill=255)
+        img_width, img_height = self.original_image.size
+        xs, ys = zip(*pil_path)  # O(P) over path points instead of a raster scan of the mask
+        bbox = (max(0, min(xs)), max(0, min(ys)), min(img_width, max(xs) + 1), min(img_height, max(ys) + 1))
         
-        # Extract the selected area from original image with transparency
-        # Create RGBA version of original image
-        original_rgba = self.original_image.convert('RGBA')
+        # Convert hex color to RGB for the 30% tint
+        rgb_color = self._hex_to_rgb(color)
         
-        # Create transparent background
-        transparent_bg = Image.new('RGBA', self.original_image.size, (0, 0, 0, 0))
-        
-        # Apply mask to create transparent selection
-        selected_area = Image.composite(original_rgba, transparent_bg, mask)
-        
-        # Create colored overlay with 30% opacity
-        overlay = Image.new('RGBA', self.original_image.size, (0, 0, 0, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
-        
-        # Convert hex color to RGB and add 30% alpha
-        hex_color = color.lstrip('#')
-        rgb_color = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        rgba_color = rgb_color + (77,)  # 30% opacity (77/255)
-        
-        overlay_draw.polygon(pil_path, fill=rgba_color)
-        
-        # Blend the color overlay with the selected area (maintaining transparency)
-        colored_section = Image.alpha_composite(selected_area, overlay)
-        
-        # Get bounding box of the selection
-        bbox = mask.getbbox()
-        if bbox:
-            # Crop the colored section to its bounding box
-            cropped_section = colored_section.crop(bbox)
+        bbox_size = (bbox[2] - bbox[0], bbox[3] - bbox[1])  # (width, height), computed once
+        if bbox_size[0] > 0 and bbox_size[1] > 0:
+            # Rasterize the polygon into a bbox-sized mask only
+            mask = Image.new('L', bbox_size, 0)
+            ImageDraw.Draw(mask).polygon([(x - bbox[0], y - bbox[1]) for x, y in pil_path], fill=255)
+            
+            # Tint the bbox crop with uint8 array math and a single fromarray at the end
+            mask_np = np.asarray(mask)
+            src = np.asarray(self.original_image.crop(bbox).convert('RGB'))
+            cropped_section = self._blend_tint(src, mask_np, rgb_color)
+            
+            # Contiguous (N, 2) float32 boundary instead of a list of tuples
+            boundary = np.asarray(path, dtype=np.float32)
             
             # Store the clipped section data
             clipped_section = {
                 'image': cropped_section,
                 'position': bbox[:2],  # (x, y) of top-left corner
-                'size': (bbox[2] - bbox[0], bbox[3] - bbox[1]),  # (width, height)
-                'boundary': path,  # Original selection boundary for hit detection
+                'size': bbox_size,  # (width, height)
                 'color': color,
+                'rgb': rgb_color,  # Parsed once - no hex parsing on later redraws
                 'id': len(self.clipped_sections),
-                'original_image': cropped_section.copy(),  # Store original for resize
-                'original_boundary': path.copy(),  # Store original boundary
+                'original_image': cropped_section,  # Shared with 'image' - never mutated in place, resize makes a new image
+                'original_boundary': boundary,  # Shared immutable array - moves use the offset vector
                 'original_bbox': bbox,  # Store original bbox
-                'original_size': (bbox[2] - bbox[0], bbox[3] - bbox[1])  # Store original size
+                'original_size': bbox_size  # Store original size
             }
             
+            self._set_section_boundary(clipped_section, boundary)
+            clipped_section['mask_bits'] = self._pack_mask(mask_np)  # Bit-packed mask for O(1) hit tests
+            # Closed (N + 1) cut-outline arrays for the near-edge PNPOLY test, in the same frame as
+            # the mask - first vertex repeated so edges are the [:-1]/[1:] views
+            clipped_section['boundary_xs'] = np.concatenate((boundary[:, 0], boundary[:1, 0])).astype(np.float64)
+            clipped_section['boundary_ys'] = np.concatenate((boundary[:, 1], boundary[:1, 1])).astype(np.float64)
+            
             print(f"DEBUG: Adding clipped section to list, current count: {len(self.clipped_sections)}")
             self.clipped_sections.append(clipped_section)
             print(f"DEBUG: Clipped sections count after append: {len(self.clipped_sections)}")
             
-            # Ensure working image exists
-            if self.working_image is None:
-                self.working_image = self.original_image.copy()
+            # Remove the area from the working image in place (create hole with white background)
+            # Only the bbox region is touched through the small mask - no full-image copy
+            # (beyond the one-time copy if the working image still shares the original).
+            # 'white' resolves to the working image's own mode (L/RGB/RGBA)
+            self._mutable_working_image().paste('white', bbox, mask)
             
-            # Remove the area from the working image (create hole with white background)
-            # Create a mask where the selected area becomes white (background color)
-            working_copy = self.working_image.copy()
-            working_draw = ImageDraw.Draw(working_copy)
-            working_draw.polygon(pil_path, fill=(255, 255, 255))  # Fill with white background
-            
-            self.working_image = working_copy
-            
-            # Clear image cache to force refresh with the hole
-            self.display_cache.clear()
-            self.image_pyramid.clear()
+            # Refresh only cached renders touched by the hole
+            self._invalidate_cached_region(bbox)
             
             # Update the sections list
             print(f"DEBUG: Updating sections list")
@@ -2597,6 +2963,24 @@ class ImageEditor:
             print(f"DEBUG: Section creation completed successfully")
             messagebox.showinfo("Clipped", f"Section clipped and colored! Switch to 'Move' mode to reposition it.")
         
+    @staticmethod
+    def _hex_to_rgb(hex_color):
+        """'#rrggbb' -> (r, g, b) ints"""
+        return struct.unpack('BBB', bytes.fromhex(hex_color.lstrip('#')))
+    
+    @staticmethod
+    def _blend_tint(src, mask_np, rgb_color, alpha=77):
+        """Tint masked pixels of an (H, W, 3) uint8 crop and return it as RGBA (mask as alpha)"""
+        out = np.empty(src.shape[:2] + (4,), dtype=np.uint8)
+        out[..., :3] = src
+        out[..., 3] = mask_np
+        
+        # Blend only the selected pixels: src*(1-a) + color*a with a = alpha/255, integer math
+        selected = mask_np > 0
+        tint = np.array(rgb_color, dtype=np.uint16) * alpha
+        out[selected, :3] = (src[selected].astype(np.uint16) * (255 - alpha) + tint + 127) // 255
+        return Image.fromarray(out, 'RGBA')
+    
     def move_clipped_section(self, section_idx, dx, dy):
         """Move a clipped section with optional light buffering for smooth motion"""
         if not (0 <= section_idx < len(self.clipped_sections)):
@@ -2613,19 +2997,19 @@ class ImageEditor:
             # Get smoothed movement with less restriction
             if self.should_update_display() or abs(dx) > 1 or abs(dy) > 1:
                 smooth_dx, smooth_dy = self.get_smoothed_movement()
-                section['position'] = (x + smooth_dx, y + smooth_dy)
+                self._update_section_geometry(section_idx, (x + smooth_dx, y + smooth_dy))
                 # Update boundary for hit detection
-                section['boundary'] = [(bx + smooth_dx, by + smooth_dy) for bx, by in section['boundary']]
+                self._translate_section(section_idx, smooth_dx, smooth_dy)
             else:
                 return  # Skip update for very small movements
         else:
             # Direct movement without buffering for maximum speed
-            section['position'] = (x + dx, y + dy)
+            self._update_section_geometry(section_idx, (x + dx, y + dy))
             # Update boundary for hit detection
-            section['boundary'] = [(bx + dx, by + dy) for bx, by in section['boundary']]
+            self._translate_section(section_idx, dx, dy)
         
-        # Always update display for responsive feedback
-        self.display_image()
+        # Always update display for responsive feedback (coalesced per idle cycle)
+        self._schedule_redraw()
     
     def move_clipped_section_direct(self, section_idx, dx, dy):
         """Direct movement without buffering - used internally by interpolation"""
@@ -2646,27 +3030,22 @@ class ImageEditor:
             new_x = round(new_x)
             new_y = round(new_y)
         
-        section['position'] = (new_x, new_y)
+        self._update_section_geometry(section_idx, (new_x, new_y))
         
         # Update boundary for hit detection
         actual_dx = new_x - old_x
         actual_dy = new_y - old_y
-        section['boundary'] = [(x + actual_dx, y + actual_dy) for x, y in section['boundary']]
+        self._translate_section(section_idx, actual_dx, actual_dy)
         
-        # Only update display if significant change
+        # Only update display if significant change (coalesced to one redraw per idle cycle)
         if abs(actual_dx) > 0.01 or abs(actual_dy) > 0.01:
-            self.display_image()
+            self._schedule_redraw()
             
             # Show precise coordinates in status (less frequently to avoid spam)
-            if hasattr(self, '_last_status_update'):
-                import time
-                if time.time() - self._last_status_update > 0.1:  # Update status every 100ms max
-                    self._update_movement_status(section_idx, new_x, new_y)
-                    self._last_status_update = time.time()
-            else:
+            now = monotonic_ns() // 1_000_000
+            if now - getattr(self, '_last_status_update', -100) >= 100:  # Update status every 100ms max
                 self._update_movement_status(section_idx, new_x, new_y)
-                import time
-                self._last_status_update = time.time()
+                self._last_status_update = now
     
     def _update_movement_status(self, section_idx, x, y):
         """Update status bar with movement information"""
@@ -2694,7 +3073,7 @@ class ImageEditor:
             step_value_cm = float(self.movement_step_var.get())
             
             # Convert cm to pixels
-            step_pixels = self.cm_to_pixels(step_value_cm)
+            step_pixels = step_value_cm * self._px_per_cm
             
             # Calculate movement delta
             dx = direction_x * step_pixels
@@ -2731,42 +3110,161 @@ class ImageEditor:
         if selection:
             selected_idx = selection[0]
             if (selected_idx < len(self.clipped_sections) and 
-                self.point_in_polygon(x, y, self.clipped_sections[selected_idx]['boundary'])):
+                self._section_contains_point(self.clipped_sections[selected_idx], x, y)):
                 return selected_idx
         
-        # If current selection doesn't contain point, find any section that does
-        # Check in reverse order so top sections (drawn last) are selected first
-        for i in reversed(range(len(self.clipped_sections))):
-            if self.point_in_polygon(x, y, self.clipped_sections[i]['boundary']):
-                # Auto-select this section in the listbox
-                self.sections_listbox.selection_clear(0, tk.END)
-                self.sections_listbox.selection_set(i)
-                self.sections_listbox.activate(i)
-                return i
+        # If current selection doesn't contain point, find the topmost section that does
+        # (bbox reject for all sections at once, then mask bit lookups / PNPOLY near edges)
+        hit = self._find_topmost_section(x, y)
+        if hit >= 0:
+            # Auto-select this section in the listbox
+            self.sections_listbox.selection_clear(0, tk.END)
+            self.sections_listbox.selection_set(hit)
+            self.sections_listbox.activate(hit)
+            return hit
         return None
-        
-    def point_in_polygon(self, x, y, polygon):
-        """Check if point is inside polygon using ray casting algorithm"""
-        if len(polygon) < 3:
+    
+    def _find_topmost_section(self, x, y):
+        """Index of the topmost (last drawn) section containing the point, or -1"""
+        if not self.clipped_sections:
+            return -1
+        
+        # Cheap vectorized bbox reject first
+        positions, sizes = self._get_section_arrays()
+        in_bbox = ((x >= positions[:, 0]) & (x < positions[:, 0] + sizes[:, 0]) &
+                   (y >= positions[:, 1]) & (y < positions[:, 1] + sizes[:, 1]))
+        candidates = np.flatnonzero(in_bbox)
+        if candidates.size == 0:
+            return -1
+        
+        # O(1) bit lookups in the candidates' packed masks, topmost first
+        for i in reversed(candidates.tolist()):
+            if self._section_contains_point(self.clipped_sections[i], x, y):
+                return i
+        return -1
+    
+    def _set_section_boundary(self, section, boundary):
+        """Store a section boundary as untranslated vertices plus an offset vector"""
+        section['boundary_base'] = boundary  # Vertices without translation
+        section['offset'] = np.zeros(2, dtype=np.float64)  # Translation applied on top of the base
+        section['boundary_i'] = None  # Integer PIL path, built on first use
+        self._invalidate_section_index()  # SoA section arrays are stale now
+    
+    def _invalidate_section_index(self):
+        """Mark the SoA section arrays for rebuild"""
+        self._section_arrays_valid = False
+    
+    def _get_section_arrays(self):
+        """Return SoA (positions, sizes) arrays parallel to clipped_sections"""
+        if not self._section_arrays_valid or len(self._section_positions) != len(self.clipped_sections):
+            n = len(self.clipped_sections)
+            self._section_positions = np.zeros((n, 2), dtype=np.float32)
+            self._section_sizes = np.zeros((n, 2), dtype=np.int32)
+            for i, section in enumerate(self.clipped_sections):
+                self._section_positions[i] = section['position']
+                self._section_sizes[i] = section['size']
+            self._section_arrays_valid = True
+        return self._section_positions, self._section_sizes
+    
+    def _update_section_geometry(self, section_idx, position, size=None):
+        """Set a section's position (and optionally size), keeping the SoA arrays in sync"""
+        section = self.clipped_sections[section_idx]
+        section['position'] = position
+        if size is not None:
+            section['size'] = size
+        if self._section_arrays_valid and section_idx < len(self._section_positions):
+            self._section_positions[section_idx] = position
+            if size is not None:
+                self._section_sizes[section_idx] = size
+    
+    def _sections_in_rect(self, x0, y0, x1, y1, scale=1.0):
+        """Indices of sections whose (scaled) bbox overlaps the given rect"""
+        positions, sizes = self._get_section_arrays()
+        if len(positions) == 0:
+            return np.empty(0, dtype=np.intp)
+        mins = np.trunc(positions * scale)
+        maxs = mins + np.trunc(sizes * scale)
+        overlap = ((maxs[:, 0] >= x0) & (mins[:, 0] <= x1) &
+                   (maxs[:, 1] >= y0) & (mins[:, 1] <= y1))
+        return np.flatnonzero(overlap)
+    
+    def _translate_section(self, section_idx, dx, dy):
+        """Move a section boundary in O(1) by updating its offset vector"""
+        section = self.clipped_sections[section_idx]
+        section['offset'] += (dx, dy)
+        section['boundary_i'] = None
+    
+    def _section_boundary(self, section):
+        """Current (N, 2) boundary of a section, computed on demand from base + offset"""
+        return section['boundary_base'] + section['offset'].astype(np.float32)
+    
+    def _section_pil_path(self, section):
+        """Flat integer [x0, y0, x1, y1, ...] path of a section for ImageDraw, cached until it moves"""
+        if section.get('boundary_i') is None:
+            section['boundary_i'] = self._section_boundary(section).astype(np.int32).ravel().tolist()
+        return section['boundary_i']
+    
+    @staticmethod
+    def _pack_mask(mask_np):
+        """Bit-pack an (H, W) mask into rows of uint64 words (bit col & 63 of word col >> 6)"""
+        height, width = mask_np.shape
+        padded = np.zeros((height, (width + 63) // 64 * 64), dtype=bool)
+        padded[:, :width] = mask_np > 0
+        return np.packbits(padded, axis=1, bitorder='little').view('<u8')
+    
+    def _mask_contains_point(self, section, x, y):
+        """O(1) containment test against the section's bit-packed selection mask:
+        True/False, or None when the point is on the mask's edge (3x3 neighbourhood not uniform)"""
+        px, py = section['position']
+        width, height = section['size']
+        if not (px <= x < px + width and py <= y < py + height):
+            return False
+        # Map into the mask's (original size) local coordinates
+        orig_width, orig_height = section['original_size']
+        col = int((x - px) * orig_width / width)
+        row = int((y - py) * orig_height / height)
+        packed = section['mask_bits']
+        if row >= packed.shape[0] or col >= orig_width:
             return False
-            
-        n = len(polygon)
-        inside = False
-        
-        p1x, p1y = polygon[0]
-        for i in range(1, n + 1):
-            p2x, p2y = polygon[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-            
-        return inside
         
+        inside = (int(packed[row, col >> 6]) >> (col & 63)) & 1
+        for r in range(max(row - 1, 0), min(row + 2, packed.shape[0])):
+            for c in range(max(col - 1, 0), min(col + 2, orig_width)):
+                if (int(packed[r, c >> 6]) >> (c & 63)) & 1 != inside:
+                    return None
+        return bool(inside)
+    
+    def _section_contains_point(self, section, x, y):
+        """Hit-test a section with its packed mask, falling back to PNPOLY on the boundary near edges"""
+        inside = self._mask_contains_point(section, x, y)
+        if inside is not None:
+            return inside
+        if len(section['boundary_xs']) < 4:
+            return False
+        # Map the query point into the cut-outline frame the same way the mask lookup does
+        # (position/size -> original bbox), so moved, resized and duplicated sections agree
+        px, py = section['position']
+        width, height = section['size']
+        orig_width, orig_height = section['original_size']
+        bx, by = section['original_bbox'][:2]
+        qx = bx + (x - px) * orig_width / width
+        qy = by + (y - py) * orig_height / height
+        if HAS_NUMBA:
+            return bool(_pnpoly(float(qx), float(qy), section['boundary_xs'], section['boundary_ys']))
+        return self._point_in_closed_polygon(qx, qy, section['boundary_xs'], section['boundary_ys'])
+    
+    @staticmethod
+    def _point_in_closed_polygon(x, y, xs, ys):
+        """Vectorized ray casting against closed vertex arrays, edges as zero-copy views"""
+        x1, y1 = xs[:-1], ys[:-1]
+        x2, y2 = xs[1:], ys[1:]
+        
+        # Edge straddles the horizontal ray and the point lies left of it (cross-product sign,
+        # no division and no zero-height-edge guard needed)
+        cross = (y - y1) * (x2 - x1) - (x - x1) * (y2 - y1)
+        crossings = ((y1 > y) != (y2 > y)) & ((y2 > y1) == (cross > 0))
+        return bool(np.count_nonzero(crossings) & 1)
+    
     def apply_color_to_section(self, section_idx):
         """This function is no longer needed - clipping and coloring happen together"""
         pass
@@ -2898,6 +3396,7 @@ class ImageEditor:
             # Apply new scroll positions
             self.canvas.xview_moveto(new_x_top)
             self.canvas.yview_moveto(new_y_top)
+            self._schedule_section_cull()
             
             # Provide feedback
             keys = "WASD/Arrow keys"
@@ -2918,10 +3417,9 @@ class ImageEditor:
             # Calculate megapixels for performance optimization
             megapixels = (img_width * img_height) / 1_000_000
             
-            # Update canvas to get current size
-            self.canvas.update_idletasks()
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
+            # Current canvas size (tracked via <Configure>)
+            canvas_width = self._canvas_w
+            canvas_height = self._canvas_h
             
             # Calculate fit-to-window scale
             fit_scale = 1.0
@@ -3039,6 +3537,7 @@ class ImageEditor:
             
         # Clear previous line objects
         self.line_objects = []
+        self._line_ids = {}
         
         # Get image dimensions and scale
         orig_width, orig_height = self.original_image.size
@@ -3069,20 +3568,13 @@ class ImageEditor:
             x_pos_display = x_pos_image * self.image_scale
             
             # Draw line from top to bottom of the displayed image
-            if self.lines_confirmed:
-                line_color = '#00FF00'  # Green if confirmed
-                line_width = 3
-            elif self.dragging_line == i:
-                line_color = '#FFD700'  # Gold if being dragged
-                line_width = 4
-            else:
-                line_color = '#FF0000'  # Red if not confirmed
-                line_width = 2
+            line_color, line_width = self._line_style(i)
             
             # Create line and store its ID
             line_id = self.canvas.create_line(x_pos_display, 0, x_pos_display, display_height,
                                            fill=line_color, width=line_width, tags="guide_lines")
             self.line_objects.append(line_id)
+            self._line_ids[i] = line_id
     
     def draw_grid(self):
         """Draw grid overlay on canvas for precise positioning"""
@@ -3095,83 +3587,86 @@ class ImageEditor:
         display_height = int(orig_height * self.image_scale)
         
         # Calculate grid spacing in centimeters (always use cm now)
-        grid_spacing_real = self.cm_to_pixels(self.grid_size_cm)
+        grid_spacing_real = self._grid_spacing_px
         
         # Calculate grid spacing in display coordinates
         grid_spacing_display = grid_spacing_real * self.image_scale
         
-        # Draw vertical grid lines
-        x = 0
-        line_count = 0
-        while x <= display_width:
-            # Make every 5th line slightly thicker for major grid lines
-            line_width = 2 if line_count % 5 == 0 else 1
-            line_color = "#999999" if line_count % 5 == 0 else "#CCCCCC"
-            
-            self.canvas.create_line(x, 0, x, display_height,
-                                  fill=line_color, width=line_width, tags="grid_line")
-            x += grid_spacing_display
-            line_count += 1
-        
-        # Draw horizontal grid lines
-        y = 0
-        line_count = 0
-        while y <= display_height:
-            # Make every 5th line slightly thicker for major grid lines
-            line_width = 2 if line_count % 5 == 0 else 1
-            line_color = "#999999" if line_count % 5 == 0 else "#CCCCCC"
-            
-            self.canvas.create_line(0, y, display_width, y,
-                                  fill=line_color, width=line_width, tags="grid_line")
-            y += grid_spacing_display
-            line_count += 1
+        if grid_spacing_display <= 0:
+            return
+        
+        # Precompute all line positions; every 5th line is a major (thicker) grid line
+        xs = np.arange(int(display_width // grid_spacing_display) + 1) * grid_spacing_display
+        ys = np.arange(int(display_height // grid_spacing_display) + 1) * grid_spacing_display
+        x_major = np.arange(len(xs)) % 5 == 0
+        y_major = np.arange(len(ys)) % 5 == 0
+        
+        # Typical grids: a few hundred create_line calls are cheaper than pushing a display-sized
+        # overlay through PhotoImage. Dense grids are rasterized once and reused across redraws
+        if len(xs) + len(ys) > 256 and display_width * display_height <= self.max_display_pixels:
+            key = (display_width, display_height, grid_spacing_display)
+            if self._grid_photo_key != key:
+                self._grid_photo = ImageTk.PhotoImage(
+                    self._render_grid_overlay(display_width, display_height, xs, ys, x_major, y_major))
+                self._grid_photo_key = key
+            self.canvas.create_image(0, 0, anchor=tk.NW, image=self._grid_photo, tags="grid_line")
+            
+            # Draw grid labels for major lines (every 5th line) when in cm mode
+            if self.image_scale > 0.5:  # Only show labels when zoomed in enough
+                self._draw_grid_labels(display_width, display_height, grid_spacing_display)
+            return
+        
+        # Draw minor lines first, then major lines on top
+        for is_major, line_color, line_width in ((False, "#CCCCCC", 1), (True, "#999999", 2)):
+            # Vertical grid lines
+            for x in xs[x_major == is_major].tolist():
+                self.canvas.create_line(x, 0, x, display_height,
+                                      fill=line_color, width=line_width, tags="grid_line")
+            # Horizontal grid lines
+            for y in ys[y_major == is_major].tolist():
+                self.canvas.create_line(0, y, display_width, y,
+                                      fill=line_color, width=line_width, tags="grid_line")
         
         # Draw grid labels for major lines (every 5th line) when in cm mode
         if self.image_scale > 0.5:  # Only show labels when zoomed in enough
             self._draw_grid_labels(display_width, display_height, grid_spacing_display)
     
+    @staticmethod
+    def _render_grid_overlay(display_width, display_height, xs, ys, x_major, y_major):
+        """Render grid lines into a transparent RGBA image (minor 1px, major 2px)"""
+        arr = np.zeros((display_height, display_width, 4), dtype=np.uint8)
+        minor_color = (204, 204, 204, 255)  # #CCCCCC
+        major_color = (153, 153, 153, 255)  # #999999
+        
+        cols = np.clip(np.round(xs).astype(np.intp), 0, display_width - 1)
+        rows = np.clip(np.round(ys).astype(np.intp), 0, display_height - 1)
+        arr[:, cols[~x_major]] = minor_color
+        arr[rows[~y_major], :] = minor_color
+        
+        # Major lines are two pixels wide
+        major_cols = np.clip(np.concatenate((cols[x_major], cols[x_major] + 1)), 0, display_width - 1)
+        major_rows = np.clip(np.concatenate((rows[y_major], rows[y_major] + 1)), 0, display_height - 1)
+        arr[:, major_cols] = major_color
+        arr[major_rows, :] = major_color
+        return Image.fromarray(arr, 'RGBA')
+    
     def _draw_grid_labels(self, display_width, display_height, grid_spacing_display):
         """Draw measurement labels on major grid lines (always in cm)"""
-        major_spacing = grid_spacing_display * 5  # Every 5th line
-        
-        # Get the actual grid spacing in image pixels (always cm based now)
-        grid_spacing_real = self.cm_to_pixels(self.grid_size_cm)
-        major_spacing_real = grid_spacing_real * 5  # Every 5th line in real pixels
-        
-        # Draw vertical labels (showing X coordinates)
-        x_display = 0
-        x_real = 0
-        grid_count = 0
-        while x_display <= display_width:
-            if grid_count > 0 and grid_count % 5 == 0:  # Every 5th line
-                # Show cm values: each major line represents (grid_count // 5) * 5 * grid_size_cm
-                # Or more simply: grid_count * grid_size_cm
-                cm_value = grid_count * self.grid_size_cm
-                label_text = f"{cm_value:.1f}cm"
-                
-                self.canvas.create_text(x_display, 15, text=label_text, fill="#666666",
-                                      font=('Arial', 8), tags="grid_line")
-            
-            x_display += grid_spacing_display
-            x_real += grid_spacing_real
-            grid_count += 1
+        # Grid indices of major lines (every 5th, skipping the origin)
+        x_counts = np.arange(5, int(display_width // grid_spacing_display) + 1, 5)
+        y_counts = np.arange(5, int(display_height // grid_spacing_display) + 1, 5)
+        
+        # Draw vertical labels (showing X coordinates): grid_count * grid_size_cm
+        for grid_count in x_counts.tolist():
+            cm_value = grid_count * self.grid_size_cm
+            self.canvas.create_text(grid_count * grid_spacing_display, 15, text=f"{cm_value:.1f}cm",
+                                  fill="#666666", font=('Arial', 8), tags="grid_line")
         
         # Draw horizontal labels (showing Y coordinates)
-        y_display = 0
-        y_real = 0
-        grid_count = 0
-        while y_display <= display_height:
-            if grid_count > 0 and grid_count % 5 == 0:  # Every 5th line
-                # Show cm values: each major line represents grid_count * grid_size_cm
-                cm_value = grid_count * self.grid_size_cm
-                label_text = f"{cm_value:.1f}cm"
-                
-                self.canvas.create_text(35, y_display, text=label_text, fill="#666666",
-                                      font=('Arial', 8), tags="grid_line")
-            
-            y_display += grid_spacing_display
-            y_real += grid_spacing_real
-            grid_count += 1
+        for grid_count in y_counts.tolist():
+            cm_value = grid_count * self.grid_size_cm
+            self.canvas.create_text(35, grid_count * grid_spacing_display, text=f"{cm_value:.1f}cm",
+                                  fill="#666666", font=('Arial', 8), tags="grid_line")
     
     def draw_ruler(self):
         """Draw the measurement ruler if enabled and positioned"""
@@ -3184,17 +3679,7 @@ class ImageEditor:
         end_x = int(self.ruler_end[0] * self.image_scale)
         end_y = int(self.ruler_end[1] * self.image_scale)
         
-        # Draw ruler line
-        self.canvas.create_line(start_x, start_y, end_x, end_y,
-                              fill="#FF4444", width=3, tags="ruler")
-        
-        # Draw ruler endpoints
-        self.canvas.create_oval(start_x-5, start_y-5, start_x+5, start_y+5,
-                              fill="#FF4444", outline="#CC0000", width=2, tags="ruler")
-        self.canvas.create_oval(end_x-5, end_y-5, end_x+5, end_y+5,
-                              fill="#FF4444", outline="#CC0000", width=2, tags="ruler")
-        
-        # Calculate and display measurement
+        # Calculate measurement
         _, real_pixels, cm_distance = self.calculate_distance(
             self.ruler_start[0], self.ruler_start[1],
             self.ruler_end[0], self.ruler_end[1]
@@ -3204,15 +3689,37 @@ class ImageEditor:
         measurement_text = f"Distance: {real_pixels:.1f} px ({cm_distance:.2f} cm)"
         self.ruler_measurement_var.set(measurement_text)
         
-        # Draw measurement text on canvas
         mid_x = (start_x + end_x) // 2
         mid_y = (start_y + end_y) // 2 - 20
         
-        # Create background for text
-        self.canvas.create_rectangle(mid_x-50, mid_y-8, mid_x+50, mid_y+8,
-                                   fill="#FFFFFF", outline="#FF4444", width=1, tags="ruler")
-        self.canvas.create_text(mid_x, mid_y, text=f"{cm_distance:.2f} cm",
-                              fill="#FF4444", font=('Arial', 10, 'bold'), tags="ruler")
+        # Reuse the persistent ruler items when they are still on the canvas
+        if self._ruler_item_ids and all(self._canvas_item_exists(item) for item in self._ruler_item_ids):
+            line_id, start_id, end_id, label_bg_id, label_id = self._ruler_item_ids
+            self.canvas.coords(line_id, start_x, start_y, end_x, end_y)
+            self.canvas.coords(start_id, start_x-5, start_y-5, start_x+5, start_y+5)
+            self.canvas.coords(end_id, end_x-5, end_y-5, end_x+5, end_y+5)
+            self.canvas.coords(label_bg_id, mid_x-50, mid_y-8, mid_x+50, mid_y+8)
+            self.canvas.coords(label_id, mid_x, mid_y)
+            self.canvas.itemconfig(label_id, text=f"{cm_distance:.2f} cm")
+            return
+        
+        # Draw ruler line
+        line_id = self.canvas.create_line(start_x, start_y, end_x, end_y,
+                                          fill="#FF4444", width=3, tags="ruler")
+        
+        # Draw ruler endpoints
+        start_id = self.canvas.create_oval(start_x-5, start_y-5, start_x+5, start_y+5,
+                                           fill="#FF4444", outline="#CC0000", width=2, tags="ruler")
+        end_id = self.canvas.create_oval(end_x-5, end_y-5, end_x+5, end_y+5,
+                                         fill="#FF4444", outline="#CC0000", width=2, tags="ruler")
+        
+        # Draw measurement text on canvas with a background
+        label_bg_id = self.canvas.create_rectangle(mid_x-50, mid_y-8, mid_x+50, mid_y+8,
+                                                   fill="#FFFFFF", outline="#FF4444", width=1, tags="ruler")
+        label_id = self.canvas.create_text(mid_x, mid_y, text=f"{cm_distance:.2f} cm",
+                                           fill="#FF4444", font=('Arial', 10, 'bold'), tags="ruler")
+        
+        self._ruler_item_ids = (line_id, start_id, end_id, label_bg_id, label_id)
     
     def resize_image_to_fit(self):
         """Resize image based on width/height percentage"""
@@ -3227,9 +3734,8 @@ class ImageEditor:
             orig_width, orig_height = self.original_image.size
             
             # Get canvas size for reference
-            self.canvas.update_idletasks()
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
+            canvas_width = self._canvas_w
+            canvas_height = self._canvas_h
             
             if canvas_width > 50 and canvas_height > 50:
                 # Calculate scale to fit the percentage of canvas
@@ -3254,8 +3760,7 @@ class ImageEditor:
             return
             
         # Get canvas dimensions
-        self.canvas.update_idletasks()
-        canvas_width = self.canvas.winfo_width()
+        canvas_width = self._canvas_w
         
         if canvas_width <= 50:
             return
@@ -3272,10 +3777,17 @@ class ImageEditor:
         orig_width, orig_height = self.original_image.size
         new_scale = target_width / orig_width
         
+        # Snap to a nearby 1/N scale (within 2%) so the display path can use an integer reduce
+        if new_scale < 1.0:
+            k = round(1.0 / new_scale)
+            if k >= 2 and abs(1.0 / k - new_scale) / new_scale < 0.02:
+                new_scale = 1.0 / k
+                target_width = orig_width * new_scale
+        
         self.image_scale = new_scale
         
         # Update the percentage controls to reflect the new size
-        canvas_height = self.canvas.winfo_height()
+        canvas_height = self._canvas_h
         if canvas_height > 50:
             width_percent = int((target_width / canvas_width) * 100)
             height_percent = int(((orig_height * new_scale) / canvas_height) * 100)
@@ -3305,10 +3817,8 @@ class ImageEditor:
         
         # Disable line modification controls
         self.lines_scale.config(state='disabled')
-        # Find and disable the spacing spinbox
-        for widget in self.root.winfo_children():
-            for child in widget.winfo_children():
-                self._disable_spacing_controls(child)
+        for widget in self._spacing_controls:
+            widget.config(state='disabled')
         
         self.confirm_lines_button.config(state='disabled')
         self.unlock_lines_button.config(state='normal')
@@ -3325,10 +3835,8 @@ class ImageEditor:
         
         # Re-enable line modification controls
         self.lines_scale.config(state='normal')
-        # Find and enable the spacing spinbox
-        for widget in self.root.winfo_children():
-            for child in widget.winfo_children():
-                self._enable_spacing_controls(child)
+        for widget in self._spacing_controls:
+            widget.config(state='normal')
         
         self.confirm_lines_button.config(state='normal')
         self.unlock_lines_button.config(state='disabled')
@@ -3375,27 +3883,6 @@ class ImageEditor:
         
         self.update_status(f"Lines respaced equally at {self.line_spacing_cm:.1f}cm intervals")
     
-    def _disable_spacing_controls(self, widget):
-        """Helper to recursively disable spacing controls"""
-        try:
-            if isinstance(widget, tk.Spinbox) and hasattr(widget, 'get'):
-                if widget.get() == self.spacing_var.get():
-                    widget.config(state='disabled')
-            for child in widget.winfo_children():
-                self._disable_spacing_controls(child)
-        except:
-            pass
-    
-    def _enable_spacing_controls(self, widget):
-        """Helper to recursively enable spacing controls"""
-        try:
-            if isinstance(widget, tk.Spinbox) and hasattr(widget, 'get'):
-                widget.config(state='normal')
-            for child in widget.winfo_children():
-                self._enable_spacing_controls(child)
-        except:
-            pass
-    
     def update_brush_size(self, value):
         """Update brush size"""
         self.brush_size = int(float(value))
@@ -3413,12 +3900,15 @@ class ImageEditor:
             return  # Don't allow changes when lines are confirmed
             
         try:
-            self.num_lines = int(float(value))
+            new_n = int(float(value))
+            if new_n == self.num_lines:
+                return  # Scale drags often report the same value twice
+            self.num_lines = new_n
             if hasattr(self, 'lines_count_label') and self.lines_count_label:
                 self.lines_count_label.config(text=str(self.num_lines))
             
             if self.show_lines and self.original_image:
-                self.display_image()
+                self._schedule_redraw(delay_ms=120)
             
             self.update_status(f"Lines count updated to {self.num_lines}")
         except (ValueError, TypeError, AttributeError) as e:
@@ -3435,12 +3925,15 @@ class ImageEditor:
             
         try:
             if self.spacing_var:
-                self.line_spacing_cm = float(self.spacing_var.get())
+                new_spacing = float(self.spacing_var.get())
+                if abs(new_spacing - self.line_spacing_cm) < 1e-9:
+                    return  # Value unchanged - nothing to redraw
+                self.line_spacing_cm = new_spacing
                 if hasattr(self, 'spacing_value_label') and self.spacing_value_label:
                     self.spacing_value_label.config(text=f"{self.line_spacing_cm:.1f}cm")
                 
                 if self.show_lines and self.original_image:
-                    self.display_image()
+                    self._schedule_redraw(delay_ms=120)
                 
                 self.update_status(f"Line spacing updated to {self.line_spacing_cm:.1f}cm")
         except (ValueError, AttributeError, TypeError) as e:
@@ -3461,12 +3954,17 @@ class ImageEditor:
     def update_grid_size_cm(self):
         """Update grid size in centimeters"""
         try:
-            self.grid_size_cm = float(self.grid_cm_var.get())
+            grid_size_cm = float(self.grid_cm_var.get())
+            if grid_size_cm == self.grid_size_cm:
+                return  # Return pressed on the unchanged value
+            self.grid_size_cm = grid_size_cm
+            self._update_dpi_cache()
             if self.show_grid and self.original_image:
-                self.display_image()
+                self._schedule_redraw(delay_ms=120)
         except ValueError:
             self.grid_cm_var.set("1.0")
             self.grid_size_cm = 1.0
+            self._update_dpi_cache()
     
     def toggle_show_grid(self):
         """Toggle grid display"""
@@ -3510,6 +4008,7 @@ class ImageEditor:
             # Accept ANY positive DPI value - no limits!
             if new_dpi > 0:
                 self.image_dpi = new_dpi
+                self._update_dpi_cache()
                 
                 # If DPI actually changed, update all DPI-dependent elements
                 if old_dpi != self.image_dpi:
@@ -3529,6 +4028,7 @@ class ImageEditor:
         except (ValueError, TypeError):
             self.dpi_var.set("300")
             self.image_dpi = 300
+            self._update_dpi_cache()
             self.update_status("Invalid DPI value, reset to 300")
     
     def toggle_show_ruler(self):
@@ -3545,19 +4045,34 @@ class ImageEditor:
         status = "enabled" if self.show_ruler else "disabled"
         self.update_status(f"Measurement ruler {status}")
     
+    def _update_dpi_cache(self):
+        """Recompute cached unit conversion factors after a DPI or grid size change"""
+        self._px_per_cm = self.image_dpi / 2.54
+        self._cm_per_px = 1.0 / self._px_per_cm
+        self._grid_spacing_px = self.grid_size_cm * self._px_per_cm
+        self._grid_axis_cache = {}
+    
+    def _grid_axis(self, extent):
+        """Integer grid line positions along an image axis and their every-5th major mask (cached)"""
+        axis = self._grid_axis_cache.get(extent)
+        if axis is None:
+            n = min(int(extent // self._grid_spacing_px) + 1, 1000)  # Safety limit
+            axis = (np.rint(np.arange(n) * self._grid_spacing_px).astype(np.int32),
+                    np.arange(n) % 5 == 0)
+            self._grid_axis_cache[extent] = axis
+        return axis
+    
     def pixels_to_cm(self, pixels):
         """Convert pixels to centimeters based on current DPI"""
-        inches = pixels / self.image_dpi
-        return inches * 2.54  # Convert inches to cm
+        return pixels * self._cm_per_px
     
     def cm_to_pixels(self, cm):
         """Convert centimeters to pixels based on current DPI"""
-        inches = cm / 2.54  # Convert cm to inches
-        return inches * self.image_dpi
+        return cm * self._px_per_cm
     
     def get_grid_spacing_pixels(self):
         """Get grid spacing in pixels (always cm based)"""
-        return self.cm_to_pixels(self.grid_size_cm)
+        return self._grid_spacing_px
     
     def calculate_distance(self, x1, y1, x2, y2):
         """Calculate distance between two points and return in both pixels and cm"""
@@ -3584,7 +4099,8 @@ class ImageEditor:
             self.update_status("Smooth movement enabled - fluid motion activated")
         else:
             # Clear buffer when disabled
-            self.movement_buffer = []
+            self._mb_n = 0
+            self._mb_head = 0
             self.update_status("Smooth movement disabled - direct movement mode")
     
     def snap_to_grid_position(self, x, y):
@@ -3592,53 +4108,37 @@ class ImageEditor:
         if not self.snap_to_grid:
             return x, y
         
-        # Get grid spacing based on current unit
-        grid_spacing = self.get_grid_spacing_pixels()
-        
-        # Snap to nearest grid point
-        snapped_x = round(x / grid_spacing) * grid_spacing
-        snapped_y = round(y / grid_spacing) * grid_spacing
-        return snapped_x, snapped_y
+        snapped = self.snap_to_grid_positions(np.array((x, y), dtype=np.float64))
+        return float(snapped[0]), float(snapped[1])
+    
+    def snap_to_grid_positions(self, pts):
+        """Snap an array of coordinates (any shape) to the grid in one vectorized pass"""
+        pts = np.asarray(pts, dtype=np.float64)
+        if not self.snap_to_grid:
+            return pts
+        return np.round(pts / self._grid_spacing_px) * self._grid_spacing_px
     
     def add_movement_to_buffer(self, dx, dy):
-        """Add movement to buffer for smoothing"""
-        import time
-        current_time = time.time() * 1000  # Convert to milliseconds
-        
-        # Add movement to buffer
-        self.movement_buffer.append((dx, dy, current_time))
-        
-        # Keep buffer size limited
-        if len(self.movement_buffer) > self.buffer_size:
-            self.movement_buffer.pop(0)
+        """Add movement to the ring buffer for smoothing (oldest entry is overwritten)"""
+        self._mb[self._mb_head] = (dx, dy)
+        self._mb_head = (self._mb_head + 1) % self.buffer_size
+        self._mb_n = min(self._mb_n + 1, self.buffer_size)
     
     def get_smoothed_movement(self):
         """Get smoothed movement from buffer"""
-        if not self.movement_buffer:
+        n = self._mb_n
+        if n == 0:
             return 0, 0
         
-        # Calculate weighted average of recent movements
-        total_weight = 0
-        smooth_dx = 0
-        smooth_dy = 0
-        
-        for i, (dx, dy, timestamp) in enumerate(self.movement_buffer):
-            # Give more weight to recent movements
-            weight = (i + 1) / len(self.movement_buffer)
-            smooth_dx += dx * weight
-            smooth_dy += dy * weight
-            total_weight += weight
-        
-        if total_weight > 0:
-            smooth_dx /= total_weight
-            smooth_dy /= total_weight
-        
-        return smooth_dx, smooth_dy
+        # Weighted average of recent movements, more weight to recent ones
+        order = (self._mb_head - n + np.arange(n)) % self.buffer_size  # Oldest -> newest
+        w = self._weights[:n]
+        smooth_dx, smooth_dy = (self._mb[order].T @ w) / w.sum()
+        return float(smooth_dx), float(smooth_dy)
     
     def should_update_display(self):
         """Check if enough time has passed to update display (frame rate limiting)"""
-        import time
-        current_time = time.time() * 1000  # Convert to milliseconds
+        current_time = monotonic_ns() // 1_000_000  # Integer milliseconds
         
         if current_time - self.last_update_time >= self.min_update_interval:
             self.last_update_time = current_time
@@ -3646,24 +4146,16 @@ class ImageEditor:
         return False
     
     def interpolate_movement(self, section_idx, target_dx, target_dy):
-        """Smoothly interpolate movement to target position"""
+        """Move to the target position in one batched step (one coalesced redraw)"""
         if not self.movement_interpolation or section_idx >= len(self.clipped_sections):
             # Direct movement if interpolation is disabled
             self.move_clipped_section_direct(section_idx, target_dx, target_dy)
             return
         
-        # Divide movement into smaller steps for smooth animation
-        step_dx = target_dx / self.interpolation_steps
-        step_dy = target_dy / self.interpolation_steps
-        
-        def animate_step(step):
-            if step < self.interpolation_steps and section_idx < len(self.clipped_sections):
-                self.move_clipped_section_direct(section_idx, step_dx, step_dy)
-                # Schedule next step
-                self.root.after(5, lambda: animate_step(step + 1))
-        
-        # Start animation
-        animate_step(0)
+        # The interpolation steps sum to the full delta; apply it once on the next event-loop
+        # turn instead of chaining one move + redraw per step. Visual smoothing of drags is
+        # handled by the movement buffer.
+        self.root.after(0, lambda: self.move_clipped_section_direct(section_idx, target_dx, target_dy))
         
     def update_opacity(self, value):
         """Update color opacity with enhanced feedback"""
@@ -3688,35 +4180,86 @@ class ImageEditor:
         self.clipped_sections = []
         self.update_sections_list()
         if self.original_image:
-            self.working_image = self.original_image.copy()
+            self.working_image = self.original_image
             self.display_image()
             
     def undo_last_selection(self):
         """Remove the last clipped section"""
         if self.clipped_sections:
             self.clipped_sections.pop()
+            self._invalidate_section_index()
             self.update_sections_list()
-            # Rebuild the working image
-            self.rebuild_working_image()
-            self.display_image()
+            # Rebuild the working image in the background, redraw when done
+            self.rebuild_working_image_async()
             
+    def _mutable_working_image(self):
+        """Working image safe to edit in place - copied on first write while it still shares the original"""
+        if self.working_image is None or self.working_image is self.original_image:
+            self.working_image = self.original_image.copy()
+        return self.working_image
+    
     def rebuild_working_image(self):
         """Rebuild the working image with current clipped sections"""
         if not self.original_image:
             return
             
-        self.working_image = self.original_image.copy()
-        
-        # Create holes for all clipped sections
-        for section in self.clipped_sections:
-            # Use the original boundary to create holes (fill with white)
-            working_draw = ImageDraw.Draw(self.working_image)
-            pil_path = [(int(x), int(y)) for x, y in section['boundary']]
-            working_draw.polygon(pil_path, fill=(255, 255, 255))  # Fill with white background
+        self.working_image = self._build_working_image(
+            self.original_image, [self._section_pil_path(s) for s in self.clipped_sections])
         
         # Clear caches to force refresh
         self.display_cache.clear()
         self.image_pyramid.clear()
+    
+    @staticmethod
+    def _build_working_image(original_image, paths):
+        """Copy of the original with all section holes punched (pure PIL - safe off the Tk thread).
+        With no sections the original itself is returned - see _mutable_working_image."""
+        if not paths:
+            return original_image
+        working_image = original_image.copy()
+        
+        # Rasterize every section hole into one combined mask, then punch them all in one paste
+        holes = Image.new('L', original_image.size, 0)
+        holes_draw = ImageDraw.Draw(holes)
+        for path in paths:
+            holes_draw.polygon(path, fill=255)
+        working_image.paste('white', (0, 0), holes)  # Fill with white background
+        return working_image
+    
+    def rebuild_working_image_async(self):
+        """Rebuild the working image on a worker thread (PIL releases the GIL) and redraw when done"""
+        if not self.original_image:
+            return
+        
+        # Snapshot inputs on the Tk thread; the worker never touches self
+        paths = [self._section_pil_path(s) for s in self.clipped_sections]
+        self._rebuild_generation += 1
+        future = self._rebuild_executor.submit(self._build_working_image, self.original_image, paths)
+        self.root.after(15, self._finish_rebuild, future, self._rebuild_generation, self.original_image, paths)
+    
+    def _finish_rebuild(self, future, generation, original_image, paths):
+        """Poll a background rebuild from the Tk thread and swap the result in"""
+        if not future.done():
+            self.root.after(15, self._finish_rebuild, future, generation, original_image, paths)
+            return
+        if generation != self._rebuild_generation:
+            return  # Superseded by a newer rebuild
+        
+        try:
+            working_image = future.result()
+        except Exception as e:
+            print(f"Background rebuild failed, rebuilding inline: {e}")
+            working_image = None
+        
+        # Sections changed while the worker ran - its result is stale
+        if (working_image is None or original_image is not self.original_image or
+                paths != [self._section_pil_path(s) for s in self.clipped_sections]):
+            self.rebuild_working_image()
+        else:
+            self.working_image = working_image
+            self.display_cache.clear()
+            self.image_pyramid.clear()
+        self.display_image()
             
     def reset_image(self):
         """Reset the working image to the original"""
@@ -3724,24 +4267,38 @@ class ImageEditor:
             result = messagebox.askyesno("Reset Image", 
                                        "This will reset the image to its original state and remove all clipped sections. Continue?")
             if result:
-                self.working_image = self.original_image.copy()
+                self.working_image = self.original_image
                 self.clipped_sections = []
                 self.update_sections_list()
                 self.display_image()
                 messagebox.showinfo("Reset", "Image has been reset to original state")
             
     def update_sections_list(self):
-        """Update the sections listbox with enhanced formatting"""
-        self.sections_listbox.delete(0, tk.END)
-        
-        for i, section in enumerate(self.clipped_sections):
-            # Enhanced section display with more info
-            width, height = section['size']
-            color_name = section['color']
-            section_text = f"📄 Section {i+1:02d} • {color_name} • {width}×{height}px"
-            self.sections_listbox.insert(tk.END, section_text)
-        
-        # Update counters and stats
+        """Update the sections listbox with enhanced formatting (only rows that changed)"""
+        # Enhanced section display with more info
+        rows = [f"📄 Section {i+1:02d} • {section['color']} • {section['size'][0]}×{section['size'][1]}px"
+                for i, section in enumerate(self.clipped_sections)]
+        old_rows = self._section_rows
+        
+        # Rewrite rows whose text changed, then trim or extend the tail
+        for i in range(min(len(old_rows), len(rows))):
+            if old_rows[i] != rows[i]:
+                self.sections_listbox.delete(i)
+                self.sections_listbox.insert(i, rows[i])
+        if len(old_rows) > len(rows):
+            self.sections_listbox.delete(len(rows), tk.END)
+        elif len(rows) > len(old_rows):
+            self.sections_listbox.insert(tk.END, *rows[len(old_rows):])
+        self._section_rows = rows
+        
+        # Update counters and stats once per idle cycle
+        if not self._stats_dirty:
+            self._stats_dirty = True
+            self.root.after_idle(self._flush_section_stats)
+    
+    def _flush_section_stats(self):
+        """Refresh the section counters and stats labels"""
+        self._stats_dirty = False
         count = len(self.clipped_sections)
         if hasattr(self, 'sections_count_label'):
             self.sections_count_label.config(text=f"📊 Total Sections: {count}")
@@ -3793,9 +4350,9 @@ class ImageEditor:
             idx = selection[0]
             if 0 <= idx < len(self.clipped_sections):
                 self.clipped_sections.pop(idx)
+                self._invalidate_section_index()
                 self.update_sections_list()
-                self.rebuild_working_image()
-                self.display_image()
+                self.rebuild_working_image_async()
                 
     def change_section_color(self):
         """Change color of selected clipped section"""
@@ -3808,34 +4365,23 @@ class ImageEditor:
                     section = self.clipped_sections[idx]
                     old_color = section['color']
                     section['color'] = color[1]
+                    section['rgb'] = self._hex_to_rgb(color[1])
                     
-                    # Recreate the section with new color
-                    # Get the original area again
-                    mask = Image.new('L', self.original_image.size, 0)
-                    draw = ImageDraw.Draw(mask)
-                    pil_path = [(int(x), int(y)) for x, y in section['boundary']]
-                    draw.polygon(pil_path, fill=255)
-                    
-                    selected_area = Image.composite(self.original_image, Image.new('RGB', self.original_image.size, (255, 255, 255)), mask)
-                    
-                    # Create new colored overlay
-                    overlay = Image.new('RGBA', self.original_image.size, (0, 0, 0, 0))
-                    overlay_draw = ImageDraw.Draw(overlay)
-                    
-                    hex_color = color[1].lstrip('#')
-                    rgb_color = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-                    rgba_color = rgb_color + (77,)  # 30% opacity
-                    
-                    overlay_draw.polygon(pil_path, fill=rgba_color)
-                    
-                    # Blend new color
-                    selected_rgba = selected_area.convert('RGBA')
-                    colored_section = Image.alpha_composite(selected_rgba, overlay)
+                    # Recreate the section with new color from the polygon's bbox only
+                    pil_path = self._section_pil_path(section)
+                    img_width, img_height = self.original_image.size
+                    xs, ys = pil_path[0::2], pil_path[1::2]
+                    bbox = (max(0, min(xs)), max(0, min(ys)), min(img_width, max(xs) + 1), min(img_height, max(ys) + 1))
+                    bbox_size = (bbox[2] - bbox[0], bbox[3] - bbox[1])
                     
-                    # Update the section image
-                    bbox = mask.getbbox()
-                    if bbox:
-                        section['image'] = colored_section.crop(bbox)
+                    if bbox_size[0] > 0 and bbox_size[1] > 0:
+                        mask = Image.new('L', bbox_size, 0)
+                        local_path = (np.asarray(pil_path).reshape(-1, 2) - bbox[:2]).ravel().tolist()
+                        ImageDraw.Draw(mask).polygon(local_path, fill=255)
+                        
+                        # Blend new color (30% opacity) on the bbox crop
+                        src = np.asarray(self.original_image.crop(bbox).convert('RGB'))
+                        section['image'] = self._blend_tint(src, np.asarray(mask), section['rgb'])
                     
                     self.update_sections_list()
                     self.display_image()
@@ -3865,10 +4411,11 @@ class ImageEditor:
                 # Convert clipped sections to serializable format
                 serializable_sections = []
                 for section in self.clipped_sections:
+                    boundary = self._section_boundary(section)
                     serializable_sections.append({
                         'position': section['position'],
                         'size': section['size'],
-                        'boundary': section['boundary'],
+                        'boundary': boundary if HAS_ORJSON else boundary.tolist(),
                         'color': section['color'],
                         'id': section['id']
                     })
@@ -3878,8 +4425,13 @@ class ImageEditor:
                     'image_scale': self.image_scale
                 }
                 
-                with open(file_path, 'w') as f:
-                    json.dump(project_data, f, indent=2)
+                # Compact output - indentation only inflates boundary-heavy projects
+                if HAS_ORJSON:
+                    payload = orjson.dumps(project_data, option=orjson.OPT_SERIALIZE_NUMPY)
+                else:
+                    payload = json.dumps(project_data, separators=(',', ':')).encode('utf-8')
+                with open(file_path, 'wb') as f:
+                    f.write(payload)
                     
                 messagebox.showinfo("Success", "Project saved successfully")
                 
@@ -3919,6 +4471,25 @@ class ImageEditor:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load project: {str(e)}")
                 
+    @staticmethod
+    def _save_image(img, file_path):
+        """Save an exported image, writing TIFFs tiled and deflate-compressed"""
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext in ('.tif', '.tiff'):
+            if HAS_TIFFFILE and img.mode in ('RGB', 'L'):
+                tifffile.imwrite(file_path, np.asarray(img),
+                                 photometric='rgb' if img.mode == 'RGB' else 'minisblack',
+                                 tile=(512, 512), compression='zlib', compressionargs={'level': 6})
+            else:
+                img.save(file_path, compression='tiff_deflate')
+        elif ext == '.png':
+            # zlib level 1: slightly larger file, several times faster than the default 6
+            img.save(file_path, compress_level=1)
+        elif ext in ('.jpg', '.jpeg'):
+            img.save(file_path, quality=92, optimize=False)
+        else:
+            img.save(file_path)
+    
     def export_image(self):
         """Export the current working image with optional grid/lines overlay"""
         if self.working_image is None:
@@ -3927,8 +4498,8 @@ class ImageEditor:
         
         # Check if overlays are active
         has_overlays = (self.show_grid or 
-                       (self.show_lines and hasattr(self, 'line_positions')) or
-                       (hasattr(self, 'clipped_sections') and self.clipped_sections))
+                       (self.show_lines and self.line_positions) or
+                       self.clipped_sections)
         
         # If overlays are present, ask user if they want to include them
         include_overlays = False
@@ -3936,9 +4507,9 @@ class ImageEditor:
             overlay_types = []
             if self.show_grid:
                 overlay_types.append("grid")
-            if self.show_lines and hasattr(self, 'line_positions'):
+            if self.show_lines and self.line_positions:
                 overlay_types.append("vertical lines")
-            if hasattr(self, 'clipped_sections') and self.clipped_sections:
+            if self.clipped_sections:
                 overlay_types.append("colored selections")
             
             overlay_text = " and ".join(overlay_types)
@@ -3978,33 +4549,33 @@ class ImageEditor:
                     export_image = self._create_image_with_overlays()
                     self.update_status("Overlays applied successfully!")
                 else:
-                    export_image = self.working_image.copy()
+                    export_image = self.working_image  # save() only reads it
+                
+                self._save_image(export_image, file_path)
                 
-                # Verify export dimensions
+                # Export dimensions, only needed for the message below
                 export_width, export_height = export_image.size
-                original_width, original_height = self.original_image.size
                 export_mp = (export_width * export_height) / 1_000_000
                 
-                export_image.save(file_path)
-                
                 # Create success message with overlay info
                 overlay_info = ""
                 if include_overlays and has_overlays:
                     overlay_types = []
                     if self.show_grid:
                         overlay_types.append("grid")
-                    if self.show_lines and hasattr(self, 'line_positions'):
+                    if self.show_lines and self.line_positions:
                         overlay_types.append("vertical lines")
                     overlay_info = f"Overlays included: {', '.join(overlay_types)}\n"
                 
                 # Confirm full quality export
-                if export_width == original_width and export_height == original_height:
+                if export_image.size == self.original_image.size:
                     messagebox.showinfo("Success", 
                         f"Full resolution image exported successfully!\n\n"
                         f"Resolution: {export_width:,}×{export_height:,} ({export_mp:.1f}MP)\n"
                         f"{overlay_info}"
                         f"Location: {file_path}")
                 else:
+                    original_width, original_height = self.original_image.size
                     messagebox.showinfo("Success", 
                         f"Image exported successfully!\n\n"
                         f"Export resolution: {export_width:,}×{export_height:,} ({export_mp:.1f}MP)\n"
@@ -4015,84 +4586,101 @@ class ImageEditor:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export image: {str(e)}")
     
+    def _overlay_cache_key(self):
+        """Everything _create_image_with_overlays depends on (images by identity)"""
+        sections = tuple((id(section['image']), tuple(section['position']))
+                         for section in self.clipped_sections)
+        return (id(self.working_image), id(self.original_image), self.show_grid, self.show_lines,
+                self.lines_confirmed, tuple(self.line_positions),
+                self._grid_spacing_px, sections)
+    
     def _create_image_with_overlays(self):
-        """Create a copy of the working image with grid and/or lines drawn on it"""
+        """Create a copy of the working image with grid and/or lines drawn on it (cached - treat as read-only)"""
+        key = self._overlay_cache_key()
+        if self._overlay_cache is not None and self._overlay_cache[0] == key:
+            return self._overlay_cache[1]
+        overlay_image = self._render_image_with_overlays()
+        # A separate full-resolution composite is only worth holding on to while it is small
+        width, height = overlay_image.size
+        if (overlay_image is not self.working_image and overlay_image is not self.original_image
+                and width * height > self.max_overlay_cache_pixels):
+            self._overlay_cache = None
+            return overlay_image
+        # Keep the keyed images alive so their ids cannot be reused while cached
+        refs = (self.working_image, self.original_image,
+                [section['image'] for section in self.clipped_sections])
+        self._overlay_cache = (key, overlay_image, refs)
+        return overlay_image
+    
+    def _render_image_with_overlays(self):
+        """Draw the grid, lines and sections onto a copy of the working image"""
         # For overlays with clipped sections, we want to start with the original image
         # and then apply both the sections and other overlays
-        if hasattr(self, 'clipped_sections') and self.clipped_sections:
-            # Start with original image, then apply sections and overlays
-            overlay_image = self.original_image.copy()
-        else:
-            # No sections, just use working image
-            overlay_image = self.working_image.copy()
-        
-        draw = ImageDraw.Draw(overlay_image)
+        has_sections = bool(self.clipped_sections)
+        base_image = self.original_image if has_sections else self.working_image
         
         # Get image dimensions
-        img_width, img_height = overlay_image.size
+        img_width, img_height = base_image.size
+        
+        # The base is copied only if something will actually be drawn on it
+        has_lines = self.show_lines and bool(self.line_positions)
+        has_grid = (self.show_grid and self.original_image is not None and
+                    0 < self._grid_spacing_px < min(img_width, img_height))
+        if not (has_sections or has_lines or has_grid):
+            return base_image
+        
+        overlay_image = base_image.copy()
+        draw = ImageDraw.Draw(overlay_image) if (has_lines or has_grid) else None  # Sections only paste
         
         # Draw vertical lines if they're shown
-        if self.show_lines and hasattr(self, 'line_positions') and self.line_positions:
+        if has_lines:
             line_color = (0, 255, 0) if self.lines_confirmed else (255, 0, 0)  # Green if confirmed, red if not
             line_width = max(1, int(min(img_width, img_height) / 1000))  # Scale line width with image size
             if self.lines_confirmed:
                 line_width = max(2, line_width)  # Confirmed lines are thicker
             
-            for x_pos in self.line_positions:
-                # Convert to integer and ensure line position is within image bounds
-                x_pos_int = int(round(x_pos))
-                if 0 <= x_pos_int <= img_width:
-                    # Draw line from top to bottom
-                    draw.line([(x_pos_int, 0), (x_pos_int, img_height-1)], 
-                             fill=line_color, width=line_width)
+            # Integer positions within image bounds, all at once
+            xs = np.rint(np.asarray(self.line_positions, dtype=np.float64)).astype(np.int64)
+            xs = xs[(xs >= 0) & (xs <= img_width)]
+            
+            # Solid column fills from top to bottom, same as the grid lines below
+            for x0 in (xs - line_width // 2).tolist():
+                draw.rectangle([x0, 0, x0 + line_width - 1, img_height-1], fill=line_color)
         
         # Draw grid if it's shown
-        if self.show_grid and self.original_image and hasattr(self, 'image_dpi'):
+        if has_grid:
             try:
-                # Calculate grid spacing in pixels (always use cm now)
-                grid_spacing_real = self.cm_to_pixels(self.grid_size_cm)
+                # Scale line width based on image size
+                base_line_width = max(1, int(min(img_width, img_height) / 2000))
                 
-                # Ensure grid spacing is reasonable
-                if grid_spacing_real > 0 and grid_spacing_real < min(img_width, img_height):
-                    # Scale line width based on image size
-                    base_line_width = max(1, int(min(img_width, img_height) / 2000))
-                    
-                    # Draw vertical grid lines
-                    x = 0
-                    line_count = 0
-                    while x <= img_width and line_count < 1000:  # Safety limit
-                        # Make every 5th line slightly thicker for major grid lines
-                        line_width = base_line_width * 2 if line_count % 5 == 0 else base_line_width
-                        line_color = (100, 100, 100) if line_count % 5 == 0 else (180, 180, 180)  # Gray colors
-                        
-                        x_int = int(round(x))
-                        if x_int <= img_width:  # Only draw if within bounds
-                            draw.line([(x_int, 0), (x_int, img_height-1)], 
-                                     fill=line_color, width=line_width)
-                        x += grid_spacing_real
-                        line_count += 1
-                    
-                    # Draw horizontal grid lines
-                    y = 0
-                    line_count = 0
-                    while y <= img_height and line_count < 1000:  # Safety limit
-                        # Make every 5th line slightly thicker for major grid lines
-                        line_width = base_line_width * 2 if line_count % 5 == 0 else base_line_width
-                        line_color = (100, 100, 100) if line_count % 5 == 0 else (180, 180, 180)  # Gray colors
-                        
-                        y_int = int(round(y))
-                        if y_int <= img_height:  # Only draw if within bounds
-                            draw.line([(0, y_int), (img_width-1, y_int)], 
-                                     fill=line_color, width=line_width)
-                        y += grid_spacing_real
-                        line_count += 1
+                # All grid positions per axis at once; every 5th line is a major line
+                xs, major_v = self._grid_axis(img_width)
+                ys, major_h = self._grid_axis(img_height)
+                
+                # (is_major, color, width) - minor first so major lines win where they touch
+                styles = ((False, (180, 180, 180), base_line_width),
+                          (True, (100, 100, 100), base_line_width * 2))  # Gray colors
+                
+                # Axis-aligned lines are solid rectangle fills (row memsets in C) - no
+                # per-line wide-line rasterization. Rows/columns [p - w//2, p - w//2 + w)
+                
+                # Draw vertical grid lines
+                for is_major, line_color, line_width in styles:
+                    for x0 in (xs[major_v == is_major] - line_width // 2).tolist():
+                        draw.rectangle([x0, 0, x0 + line_width - 1, img_height-1], fill=line_color)
+                
+                # Draw horizontal grid lines
+                for is_major, line_color, line_width in styles:
+                    for y0 in (ys[major_h == is_major] - line_width // 2).tolist():
+                        draw.rectangle([0, y0, img_width-1, y0 + line_width - 1], fill=line_color)
             except Exception as e:
                 print(f"Warning: Could not draw grid overlay: {e}")
                 # Continue without grid if there's an error
         
         # Draw clipped sections (colored selections) if they exist
-        if hasattr(self, 'clipped_sections') and self.clipped_sections:
+        if has_sections:
             try:
+                paste = overlay_image.paste
                 for section in self.clipped_sections:
                     # Get section position and size
                     pos_x, pos_y = section['position']
@@ -4102,22 +4690,11 @@ class ImageEditor:
                     if (pos_x >= 0 and pos_y >= 0 and 
                         pos_x < img_width and pos_y < img_height):
                         
-                        # Calculate the area to paste (clip to image bounds if necessary)
-                        sect_width, sect_height = section_image.size
-                        end_x = min(pos_x + sect_width, img_width)
-                        end_y = min(pos_y + sect_height, img_height)
-                        
-                        # Crop section image if it extends beyond bounds
-                        if end_x < pos_x + sect_width or end_y < pos_y + sect_height:
-                            crop_width = end_x - pos_x
-                            crop_height = end_y - pos_y
-                            section_image = section_image.crop((0, 0, crop_width, crop_height))
-                        
-                        # Paste the section onto the overlay image
-                        if section_image.mode == 'RGBA':
-                            overlay_image.paste(section_image, (int(pos_x), int(pos_y)), section_image)
-                        else:
-                            overlay_image.paste(section_image, (int(pos_x), int(pos_y)))
+                        # Paste the section onto the overlay image - paste clips to the image
+                        # bounds itself, so sections hanging over the edge need no cropped copy.
+                        # Sections are RGBA (alpha = selection mask); a mask of None is a plain blit
+                        paste(section_image, (int(pos_x), int(pos_y)),
+                              section_image if section_image.mode == 'RGBA' else None)
             except Exception as e:
                 print(f"Warning: Could not draw clipped sections overlay: {e}")
                 # Continue without sections if there's an error
@@ -4142,6 +4719,8 @@ class ImageEditor:
         if file_paths:
             self.loaded_files = list(file_paths)
             self.loaded_images = []
+            self._merge_file_labels = {}
+            self._merge_preview_renders.clear()
             
             try:
                 self.update_status("Loading images for merge...")
@@ -4149,25 +4728,21 @@ class ImageEditor:
                 # Load all images with better error handling and no size limits
                 loaded_count = 0
                 failed_files = []
-                
-                # Temporarily disable PIL limits for all images
-                original_max_pixels = Image.MAX_IMAGE_PIXELS
-                Image.MAX_IMAGE_PIXELS = None
+                successful_files = []  # Paths of the images that loaded, index-aligned with loaded_images
                 
                 for i, file_path in enumerate(self.loaded_files):
                     try:
                         self.update_status(f"Loading image {i+1}/{len(self.loaded_files)}: {os.path.basename(file_path)}")
                         
-                        img = Image.open(file_path)
+                        img = self._open_merge_image(file_path)
                         width, height = img.size
                         megapixels = (width * height) / 1_000_000
                         
                         if megapixels > 100:  # Show info for very large images
-                            self.update_status(f"Loading large image {i+1}: {width:,}×{height:,} ({megapixels:.1f}MP)")
+                            self.update_status(f"Loading large image {i+1}: {width:,}×{height:,} ({megapixels:.1f}MP)", immediate=True)
                         
-                        if img.mode != 'RGB':
-                            img = img.convert('RGB')
                         self.loaded_images.append(img)
+                        successful_files.append(file_path)
                         loaded_count += 1
                     except Exception as file_error:
                         error_msg = str(file_error)
@@ -4176,9 +4751,6 @@ class ImageEditor:
                         failed_files.append(f"{os.path.basename(file_path)}: {error_msg}")
                         continue
                 
-                # Restore original setting
-                Image.MAX_IMAGE_PIXELS = original_max_pixels
-                
                 if failed_files:
                     error_msg = "Some files failed to load:\n" + "\n".join(failed_files[:5])
                     if len(failed_files) > 5:
@@ -4189,12 +4761,7 @@ class ImageEditor:
                     raise Exception("No images could be loaded")
                 
                 # Remove failed files from the list
-                if failed_files:
-                    successful_files = []
-                    for i, file_path in enumerate(self.loaded_files):
-                        if i < len(self.loaded_images):
-                            successful_files.append(file_path)
-                    self.loaded_files = successful_files
+                self.loaded_files = successful_files
                 
                 self.update_status(f"Loaded {loaded_count} images. Opening merge preview...")
                 
@@ -4253,10 +4820,7 @@ class ImageEditor:
         
         # File list
         self.merge_files_listbox = tk.Listbox(files_section, height=6, font=('Arial', 9))
-        for i, file_path in enumerate(self.loaded_files):
-            filename = os.path.basename(file_path)
-            img_size = self.loaded_images[i].size
-            self.merge_files_listbox.insert(tk.END, f"{i+1}. {filename} ({img_size[0]}×{img_size[1]})")
+        self._refresh_merge_rows(0)
         self.merge_files_listbox.pack(fill=tk.X, pady=(0, 10))
         
         # File controls
@@ -4405,6 +4969,17 @@ class ImageEditor:
         # Initial preview
         self.update_merge_preview()
     
+    @staticmethod
+    def _open_merge_image(file_path):
+        """Open a merge input lazily (header only) with PIL's pixel limit bypassed.
+        Pixels are decoded and converted to RGB only when a merge is rendered."""
+        original_max_pixels = Image.MAX_IMAGE_PIXELS
+        Image.MAX_IMAGE_PIXELS = None
+        try:
+            return Image.open(file_path)
+        finally:
+            Image.MAX_IMAGE_PIXELS = original_max_pixels
+    
     def add_more_files(self):
         """Add more files to the merge list"""
         if self.is_macos:
@@ -4421,27 +4996,41 @@ class ImageEditor:
         
         if file_paths:
             try:
+                first_new = len(self.loaded_files)
                 for file_path in file_paths:
                     if file_path not in self.loaded_files:
-                        img = Image.open(file_path)
-                        if img.mode != 'RGB':
-                            img = img.convert('RGB')
+                        img = self._open_merge_image(file_path)
                         
                         self.loaded_files.append(file_path)
                         self.loaded_images.append(img)
                 
-                # Update file list
-                self.merge_files_listbox.delete(0, tk.END)
-                for i, file_path in enumerate(self.loaded_files):
-                    filename = os.path.basename(file_path)
-                    img_size = self.loaded_images[i].size
-                    self.merge_files_listbox.insert(tk.END, f"{i+1}. {filename} ({img_size[0]}×{img_size[1]})")
+                # Update file list - append only the new rows
+                self._refresh_merge_rows(first_new)
                 
                 self.update_merge_preview()
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load additional images: {str(e)}")
     
+    def _merge_file_row(self, i):
+        """Listbox text for merge file i"""
+        file_path = self.loaded_files[i]
+        label = self._merge_file_labels.get(file_path)
+        if label is None:
+            img_size = self.loaded_images[i].size
+            label = f"{os.path.basename(file_path)} ({img_size[0]}×{img_size[1]})"
+            self._merge_file_labels[file_path] = label
+        return f"{i+1}. {label}"
+    
+    def _refresh_merge_rows(self, start, stop=None):
+        """Rewrite merge listbox rows [start, stop) (default: to the end) and drop any surplus rows"""
+        if stop is None:
+            stop = len(self.loaded_files)
+            self.merge_files_listbox.delete(start, tk.END)
+        else:
+            self.merge_files_listbox.delete(start, stop - 1)
+        self.merge_files_listbox.insert(start, *[self._merge_file_row(i) for i in range(start, stop)])
+    
     def remove_selected_file(self):
         """Remove selected file from merge list"""
         selection = self.merge_files_listbox.curselection()
@@ -4452,12 +5041,8 @@ class ImageEditor:
             self.loaded_files.pop(idx)
             self.loaded_images.pop(idx)
             
-            # Update file list
-            self.merge_files_listbox.delete(0, tk.END)
-            for i, file_path in enumerate(self.loaded_files):
-                filename = os.path.basename(file_path)
-                img_size = self.loaded_images[i].size
-                self.merge_files_listbox.insert(tk.END, f"{i+1}. {filename} ({img_size[0]}×{img_size[1]})")
+            # Update file list - rows after the removed one are renumbered
+            self._refresh_merge_rows(idx)
             
             self.update_merge_preview()
         elif len(self.loaded_files) <= 1:
@@ -4489,12 +5074,8 @@ class ImageEditor:
         else:
             return  # No change or cancelled
         
-        # Update file list
-        self.merge_files_listbox.delete(0, tk.END)
-        for i, file_path in enumerate(self.loaded_files):
-            filename = os.path.basename(file_path)
-            img_size = self.loaded_images[i].size
-            self.merge_files_listbox.insert(tk.END, f"{i+1}. {filename} ({img_size[0]}×{img_size[1]})")
+        # Update file list - only the two swapped rows change
+        self._refresh_merge_rows(min(idx, new_selection), max(idx, new_selection) + 1)
         
         # Restore selection
         self.merge_files_listbox.selection_set(new_selection)
@@ -4516,21 +5097,38 @@ class ImageEditor:
             
             spacing = int(self.merge_spacing_var.get())
             
-            # Create merged image preview
-            merged_img = self.create_merged_image(arrangement, spacing, preview=True)
+            # Scale down for preview (max 500px in either dimension)
+            max_preview_size = 500
             
-            if merged_img:
-                # Scale down for preview (max 500px in either dimension)
-                max_preview_size = 500
-                img_width, img_height = merged_img.size
-                
-                if img_width > max_preview_size or img_height > max_preview_size:
-                    scale_factor = min(max_preview_size / img_width, max_preview_size / img_height)
-                    new_width = int(img_width * scale_factor)
-                    new_height = int(img_height * scale_factor)
-                    preview_img = merged_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                else:
-                    preview_img = merged_img
+            # Reuse the preview of a layout already shown (e.g. toggling back and forth)
+            key = (arrangement, spacing, tuple(self.loaded_files), tuple(id(img) for img in self.loaded_images))
+            preview_img = self._merge_preview_renders.get(key)
+            if preview_img is not None:
+                self._merge_preview_renders.move_to_end(key)
+            else:
+                # Create merged image preview, composed from downscaled sources
+                merged_img = self.create_merged_image(arrangement, spacing, preview=True,
+                                                      max_size=max_preview_size)
+                if merged_img:
+                    # Trim any real overshoot of the pre-scaled composite - a few pixels of
+                    # rounding (< 5%) is displayed as is rather than resampled
+                    preview_width, preview_height = merged_img.size
+                    scale_factor = min(1.0, max_preview_size / preview_width, max_preview_size / preview_height)
+                    if scale_factor < 0.95:
+                        new_width = max(1, int(preview_width * scale_factor))
+                        new_height = max(1, int(preview_height * scale_factor))
+                        preview_img = merged_img.resize((new_width, new_height), RESAMP_PREVIEW)
+                    else:
+                        preview_img = merged_img
+                    
+                    self._merge_preview_renders[key] = preview_img
+                    if len(self._merge_preview_renders) > 8:
+                        self._merge_preview_renders.popitem(last=False)
+            
+            if preview_img is not None:
+                # Final (full-resolution) size, from image headers only
+                img_width, img_height = self._merge_layout_size(
+                    [img.size for img in self.loaded_images], arrangement, spacing)
                 
                 # Convert to PhotoImage
                 self.merge_preview_photo = ImageTk.PhotoImage(preview_img)
@@ -4565,89 +5163,151 @@ class ImageEditor:
             if hasattr(self, 'merge_summary_label'):
                 self.merge_summary_label.config(text="Error generating preview")
     
-    def create_merged_image(self, arrangement, spacing, preview=False):
-        """Create merged image based on arrangement and spacing"""
+    @staticmethod
+    def _is_undecoded(img):
+        """True for a lazily opened file image whose pixels have not been loaded yet"""
+        return bool(getattr(img, 'filename', None)) and bool(getattr(img, 'tile', None))
+    
+    @staticmethod
+    def _decode_rgb(img):
+        """Force-decode a lazily opened image and convert it to RGB (PIL releases the GIL here)"""
+        img.load()
+        return img if img.mode == 'RGB' else img.convert('RGB')
+    
+    def _materialize_merge_images(self):
+        """Decode and convert loaded merge images to RGB on first use (replaced in place, once)"""
+        pending = [i for i, img in enumerate(self.loaded_images)
+                   if img.mode != 'RGB' or getattr(img, 'tile', None)]  # tile is emptied by load()
+        if len(pending) > 1:
+            # Decode the files concurrently - libtiff/libjpeg work runs outside the GIL
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, len(pending))) as executor:
+                decoded = list(executor.map(self._decode_rgb, [self.loaded_images[i] for i in pending]))
+        else:
+            decoded = [self._decode_rgb(self.loaded_images[i]) for i in pending]
+        for i, img in zip(pending, decoded):
+            self.loaded_images[i] = img
+        return self.loaded_images
+    
+    @staticmethod
+    def _merge_layout_size(sizes, arrangement, spacing):
+        """Merged canvas size for the fixed arrangements, from (width, height) pairs only"""
+        widths = [w for w, h in sizes]
+        heights = [h for w, h in sizes]
+        if arrangement == "horizontal":
+            return sum(widths) + spacing * (len(sizes) - 1), max(heights)
+        if arrangement == "vertical":
+            return max(widths), sum(heights) + spacing * (len(sizes) - 1)
+        cols = max(1, math.isqrt(len(sizes)))
+        rows = (len(sizes) + cols - 1) // cols
+        return max(widths) * cols + spacing * (cols - 1), max(heights) * rows + spacing * (rows - 1)
+    
+    def _merge_preview_thumbnails(self, max_size):
+        """RGB thumbnails of the merge inputs (longest side <= max_size), decoded once per file set.
+        They do not depend on the layout - a preview never shows an input larger than max_size"""
+        key = (tuple(self.loaded_files), tuple(id(img) for img in self.loaded_images), max_size)
+        if self._merge_preview_cache is not None and self._merge_preview_cache[0] == key:
+            return self._merge_preview_cache[1]
+        
+        thumbnails = []
+        for img in self.loaded_images:
+            scale = min(1.0, max_size / max(img.size))
+            size = (max(1, int(img.width * scale)), max(1, int(img.height * scale)))
+            if self._is_undecoded(img):
+                # Fresh lazy handle: draft lets JPEG-compressed data decode at 1/2, 1/4 or 1/8 scale
+                with Image.open(img.filename) as src:
+                    src.draft('RGB', size)
+                    small = src.resize(size, RESAMP_PREVIEW)
+            elif size != img.size:
+                small = img.resize(size, RESAMP_PREVIEW)
+            else:
+                small = img
+            thumbnails.append(small if small.mode == 'RGB' else small.convert('RGB'))
+        
+        self._merge_preview_cache = (key, thumbnails)
+        return thumbnails
+    
+    def _merge_preview_sources(self, scale, max_size):
+        """RGB copies of the merge inputs at the given layout scale, resized from the cached thumbnails"""
+        sources = []
+        for img, thumb in zip(self.loaded_images, self._merge_preview_thumbnails(max_size)):
+            size = (max(1, int(img.width * scale)), max(1, int(img.height * scale)))
+            sources.append(thumb if thumb.size == size else thumb.resize(size, RESAMP_PREVIEW))
+        return sources
+    
+    def create_merged_image(self, arrangement, spacing, preview=False, max_size=None):
+        """Create merged image based on arrangement and spacing (preview + max_size: small composite)"""
         if not self.loaded_images:
             return None
         
-        images = self.loaded_images
+        if preview and max_size and arrangement in ("horizontal", "vertical", "grid"):
+            # Compose the preview from downscaled inputs instead of merging at full resolution
+            full_w, full_h = self._merge_layout_size([img.size for img in self.loaded_images],
+                                                     arrangement, spacing)
+            scale = min(1.0, max_size / max(full_w, full_h))
+            if scale < 1.0:
+                images = self._merge_preview_sources(scale, max_size)
+                spacing = int(round(spacing * scale))
+            else:
+                images = self._materialize_merge_images()
+        else:
+            images = self._materialize_merge_images()
         
-        if arrangement == "horizontal":
-            # Calculate total width and max height (no size limits)
-            total_width = sum(img.width for img in images) + spacing * (len(images) - 1)
-            max_height = max(img.height for img in images)
+        if arrangement in ("horizontal", "vertical", "grid"):
+            # Read every size once; canvas dimensions come from the shared layout math (no size limits)
+            sizes = [img.size for img in images]
+            total_width, total_height = self._merge_layout_size(sizes, arrangement, spacing)
             
             # Create new image
-            merged = Image.new('RGB', (total_width, max_height), 'white')
-            
+            merged = Image.new('RGB', (total_width, total_height), 'white')
+        
+        if arrangement == "horizontal":
             # Paste images side by side
             x_offset = 0
-            for img in images:
+            for img, (width, height) in zip(images, sizes):
                 # Center vertically
-                y_offset = (max_height - img.height) // 2
-                merged.paste(img, (x_offset, y_offset))
-                x_offset += img.width + spacing
+                merged.paste(img, (x_offset, (total_height - height) // 2))
+                x_offset += width + spacing
         
         elif arrangement == "vertical":
-            # Calculate max width and total height (no size limits)
-            max_width = max(img.width for img in images)
-            total_height = sum(img.height for img in images) + spacing * (len(images) - 1)
-            
-            # Create new image
-            merged = Image.new('RGB', (max_width, total_height), 'white')
-            
             # Paste images vertically
             y_offset = 0
-            for img in images:
+            for img, (width, height) in zip(images, sizes):
                 # Center horizontally
-                x_offset = (max_width - img.width) // 2
-                merged.paste(img, (x_offset, y_offset))
-                y_offset += img.height + spacing
+                merged.paste(img, ((total_width - width) // 2, y_offset))
+                y_offset += height + spacing
         
         elif arrangement == "grid":
-            # Calculate grid dimensions (try to make it as square as possible)
-            num_images = len(images)
-            cols = int(num_images ** 0.5)
-            rows = (num_images + cols - 1) // cols  # Ceiling division
-            
-            # Calculate cell size (max width/height among all images)
-            max_width = max(img.width for img in images)
-            max_height = max(img.height for img in images)
-            
-            # Calculate total dimensions (no size limits)
-            total_width = max_width * cols + spacing * (cols - 1)
-            total_height = max_height * rows + spacing * (rows - 1)
-            
-            # Create new image
-            merged = Image.new('RGB', (total_width, total_height), 'white')
+            # Grid dimensions (as square as possible) and cell size (max width/height among all images)
+            cols = max(1, math.isqrt(len(sizes)))
+            max_width = max(w for w, h in sizes)
+            max_height = max(h for w, h in sizes)
             
             # Paste images in grid
-            for i, img in enumerate(images):
-                row = i // cols
-                col = i % cols
+            for i, (img, (width, height)) in enumerate(zip(images, sizes)):
+                row, col = divmod(i, cols)
                 
-                x_offset = col * (max_width + spacing) + (max_width - img.width) // 2
-                y_offset = row * (max_height + spacing) + (max_height - img.height) // 2
+                x_offset = col * (max_width + spacing) + (max_width - width) // 2
+                y_offset = row * (max_height + spacing) + (max_height - height) // 2
                 
                 merged.paste(img, (x_offset, y_offset))
         
         elif arrangement == "freeform":
             # Calculate dynamic canvas size based on image positions and sizes
-            min_x, min_y = 0, 0
-            max_x, max_y = 0, 0
             
-            # First pass: calculate required canvas dimensions
+            # Scale positions from preview coordinate system to full resolution, all at once.
+            # The preview images are 15% scale, so positions need to be scaled up
+            # The relationship is: full_position = preview_position / preview_scale_factor
+            # (clamped to non-negative, truncated like int())
+            n_positioned = min(len(images), len(self.image_positions))
+            position_scale_factor = 1.0 / self.preview_scale_factor  # 1/0.15 ≈ 6.67
+            positions = np.asarray(self.image_positions[:n_positioned], dtype=np.float64).reshape(-1, 2)
+            positions = np.maximum(positions * position_scale_factor, 0).astype(np.int64).tolist()
+            
+            # First pass: scale images and place them
             positioned_images = []
             for i, img in enumerate(images):
-                if i < len(self.image_positions):
-                    x, y = self.image_positions[i]
-                    
-                    # Scale positions from preview coordinate system to full resolution
-                    # The preview images are 15% scale, so positions need to be scaled up
-                    # The relationship is: full_position = preview_position / preview_scale_factor
-                    position_scale_factor = 1.0 / self.preview_scale_factor  # 1/0.15 ≈ 6.67
-                    x = x * position_scale_factor
-                    y = y * position_scale_factor
+                if i < n_positioned:
+                    x, y = positions[i]
                     
                     # Apply scaling if specified
                     current_img = img
@@ -4655,26 +5315,18 @@ class ImageEditor:
                         scale = self.image_scales[i]
                         new_width = int(img.width * scale)
                         new_height = int(img.height * scale)
-                        current_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                    
-                    # Ensure positions are non-negative
-                    x, y = max(0, int(x)), max(0, int(y))
-                    
-                    # Calculate bounds needed for this image
-                    right_edge = x + current_img.width
-                    bottom_edge = y + current_img.height
-                    
-                    max_x = max(max_x, right_edge)
-                    max_y = max(max_y, bottom_edge)
+                        current_img = img.resize((new_width, new_height),
+                                                 RESAMP_PREVIEW if preview else RESAMP_EXPORT)
                     
                     positioned_images.append((current_img, x, y))
-                    print(f"Image {i}: preview pos ({self.image_positions[i][0]:.1f}, {self.image_positions[i][1]:.1f}) -> scaled pos ({x}, {y})")
-                    print(f"  Size: {current_img.width}x{current_img.height}, edges: ({right_edge}, {bottom_edge})")
                 else:
                     # Default positioning for images without specified positions
                     positioned_images.append((img, i * 50, i * 50))
-                    max_x = max(max_x, (i * 50) + img.width)
-                    max_y = max(max_y, (i * 50) + img.height)
+            
+            # Required canvas dimensions: the furthest right/bottom edge over all images
+            edges = np.array([(x + img.width, y + img.height) for img, x, y in positioned_images],
+                             dtype=np.int64).reshape(-1, 2)
+            max_x, max_y = edges.max(axis=0).tolist() if len(edges) else (0, 0)
             
             # Add some padding to the canvas
             padding = 100
@@ -4704,9 +5356,14 @@ class ImageEditor:
             merged_image = self.create_merged_image(arrangement, spacing, preview=False)
             
             if merged_image:
+                # Release the decoded full-resolution inputs now rather than after the dialogs below
+                self.loaded_images = []
+                self._merge_preview_cache = None
+                self._merge_preview_renders.clear()
+                
                 # Set as the current image
                 self.original_image = merged_image
-                self.working_image = merged_image.copy()
+                self.working_image = merged_image  # Copied on the first in-place edit
                 self.is_merged_image = True
                 
                 # Clear existing selections
@@ -4778,7 +5435,7 @@ class ImageEditor:
             
             for i, img in enumerate(self.loaded_images):
                 # Spread images in a grid pattern initially
-                cols = int(len(self.loaded_images) ** 0.5) + 1
+                cols = math.isqrt(len(self.loaded_images)) + 1
                 row = i // cols
                 col = i % cols
                 
@@ -4803,37 +5460,53 @@ class ImageEditor:
     
     def create_preview_images(self):
         """Create downscaled preview images for fast drag-and-drop performance"""
-        self.preview_images = []
         self.preview_photos = []
-        
-        for i, img in enumerate(self.loaded_images):
-            try:
-                # Calculate preview size
-                original_width, original_height = img.size
-                preview_width = int(original_width * self.preview_scale_factor)
-                preview_height = int(original_height * self.preview_scale_factor)
-                
-                # Ensure minimum size for visibility
-                preview_width = max(preview_width, 50)
-                preview_height = max(preview_height, 50)
-                
-                # Create high-quality thumbnail
-                preview_img = img.copy()
-                preview_img.thumbnail((preview_width, preview_height), Image.Resampling.LANCZOS)
-                
-                self.preview_images.append(preview_img)
-                
-                # Update status
-                self.update_status(f"Creating preview {i+1}/{len(self.loaded_images)}...")
-                self.root.update_idletasks()
-                
-            except Exception as e:
-                print(f"Error creating preview for image {i}: {e}")
-                # Create a placeholder if preview fails
-                placeholder = Image.new('RGB', (100, 100), color='lightgray')
-                self.preview_images.append(placeholder)
+        self._freeform_photo_cache.clear()  # Keyed by ids of the previews being replaced
+        
+        count = len(self.loaded_images)
+        self.update_status(f"Creating {count} preview images...", immediate=True)
+        self.root.update_idletasks()
+        if count > 1:
+            # Decode + downscale the files concurrently - PIL releases the GIL in both
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, count)) as executor:
+                self.preview_images = list(executor.map(self._make_preview_image, range(count)))
+        else:
+            self.preview_images = [self._make_preview_image(i) for i in range(count)]
         
         self.update_status("Preview images created - ready for fast drag & drop!")
+    
+    def _make_preview_image(self, i):
+        """Downscaled RGB preview of merge image i (worker thread - no Tk calls)"""
+        img = self.loaded_images[i]
+        try:
+            # Calculate preview size
+            original_width, original_height = img.size
+            preview_width = int(original_width * self.preview_scale_factor)
+            preview_height = int(original_height * self.preview_scale_factor)
+            
+            # Ensure minimum size for visibility
+            preview_width = max(preview_width, 50)
+            preview_height = max(preview_height, 50)
+            
+            # Create thumbnail from a fresh lazy handle so thumbnail() can use draft mode
+            # (reduced-scale JPEG decode) instead of decoding the full resolution first
+            if self._is_undecoded(img):
+                with Image.open(img.filename) as preview_img:
+                    preview_img.thumbnail((preview_width, preview_height), RESAMP_DOWNSCALE)
+            else:
+                # Already decoded: resize straight from it (thumbnail would need a full copy first),
+                # fitting the box with the aspect ratio kept like thumbnail() does
+                fit = min(1.0, preview_width / original_width, preview_height / original_height)
+                preview_img = img.resize((max(1, round(original_width * fit)), max(1, round(original_height * fit))),
+                                         RESAMP_DOWNSCALE, reducing_gap=2.0)
+            if preview_img.mode != 'RGB':
+                preview_img = preview_img.convert('RGB')
+            return preview_img
+            
+        except Exception as e:
+            print(f"Error creating preview for image {i}: {e}")
+            # Create a placeholder if preview fails
+            return Image.new('RGB', (100, 100), color='lightgray')
 
     def open_freeform_editor(self):
         """Open the free-form drag and drop editor"""
@@ -5103,6 +5776,8 @@ class ImageEditor:
         self.merge_preview_window = None
         self.loaded_files = []
         self.loaded_images = []
+        self._merge_preview_cache = None
+        self._merge_preview_renders.clear()
         self.image_positions = []
         self.image_scales = []
         self.update_status("Merge cancelled")
@@ -5149,6 +5824,10 @@ class ImageEditor:
         self.freeform_canvas_images = []  # Store references to prevent garbage collection
         self.preview_photos = []  # Store PhotoImage references
         
+        # Scaled PhotoImages are reused while an image's scale/zoom is unchanged (dragging only
+        # moves items) and when returning to a recent zoom level
+        photo_cache = self._freeform_photo_cache
+        
         # Only initialize positions if we need MORE positions, and only for NEW images
         initial_positions_count = len(self.image_positions)
         
@@ -5176,15 +5855,24 @@ class ImageEditor:
             # Apply both image scaling and zoom scaling to preview image
             total_scale = image_scale * self.freeform_zoom
             
-            if total_scale != 1.0:
-                new_width = max(1, int(preview_img.width * total_scale))
-                new_height = max(1, int(preview_img.height * total_scale))
-                scaled_img = preview_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            key = (id(preview_img), round(total_scale, 3))
+            cached = photo_cache.get(key)
+            if cached is not None:
+                photo, scaled_img = cached
+                photo_cache.move_to_end(key)
             else:
-                scaled_img = preview_img
-            
-            # Create PhotoImage
-            photo = ImageTk.PhotoImage(scaled_img)
+                if total_scale != 1.0:
+                    new_width = max(1, int(preview_img.width * total_scale))
+                    new_height = max(1, int(preview_img.height * total_scale))
+                    scaled_img = preview_img.resize((new_width, new_height), RESAMP_PREVIEW)
+                else:
+                    scaled_img = preview_img
+                
+                # Create PhotoImage
+                photo = ImageTk.PhotoImage(scaled_img)
+                photo_cache[key] = (photo, scaled_img)
+                if len(photo_cache) > 64:
+                    photo_cache.popitem(last=False)
             self.freeform_canvas_images.append(photo)  # Keep reference
             self.preview_photos.append(photo)  # Also store for cleanup
             
@@ -5380,8 +6068,8 @@ class ImageEditor:
             # Otherwise: image is larger than canvas, allow free positioning
             self.image_positions[self.dragging_image] = (new_x, new_y)
             
-            # Update canvas
-            self.update_freeform_canvas()
+            # Update canvas - just move the existing items, nothing is re-rendered
+            self._move_freeform_item(self.dragging_image, (old_x, old_y), (new_x, new_y))
             
 
             
@@ -5390,6 +6078,17 @@ class ImageEditor:
             # Update drag start position
             self.drag_start_pos = (canvas_x, canvas_y)
     
+    def _move_freeform_item(self, i, old_pos, new_pos):
+        """Move image i's canvas item (and its selection border) from one base position to another"""
+        zoom = self.freeform_zoom
+        # Same int() rounding as update_freeform_canvas, so items land where a full redraw puts them
+        dx = int(new_pos[0] * zoom) - int(old_pos[0] * zoom)
+        dy = int(new_pos[1] * zoom) - int(old_pos[1] * zoom)
+        if dx or dy:
+            self.freeform_canvas.move(f"img_{i}", dx, dy)
+            if i == self.selected_image_index:
+                self.freeform_canvas.move("selection", dx, dy)
+    
     def on_freeform_canvas_release(self, event):
         """Handle mouse release on free-form canvas"""
         self.dragging_image = None
@@ -5568,7 +6267,7 @@ class ImageEditor:
             
             for i, img in enumerate(self.loaded_images):
                 # Grid layout
-                cols = int(len(self.loaded_images) ** 0.5) + 1
+                cols = math.isqrt(len(self.loaded_images)) + 1
                 row = i // cols
                 col = i % cols
                 
@@ -5658,6 +6357,9 @@ class ImageEditor:
             if not self.enable_gpu_acceleration and HAS_OPENCV:
                 recommendations.append("Enable GPU acceleration if CUDA is available")
             
+            if not HAS_PILLOW_SIMD:
+                recommendations.append("Install pillow-simd in place of Pillow for faster resize/compositing")
+            
             if hit_rate < 70:
                 recommendations.append("Low cache hit rate - consider larger cache size")
             
@@ -5772,7 +6474,7 @@ class ImageEditor:
         
         if file_path:
             try:
-                merged_image.save(file_path)
+                self._save_image(merged_image, file_path)
                 messagebox.showinfo("Success", f"Merged image saved successfully!\n\nLocation: {file_path}")
                 
             except Exception as e: